@@ -4,34 +4,41 @@ ADK Chat Integration - FastAPI
 
 import os
 import time
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from fastapi import HTTPException, Depends
 from sqlalchemy.orm import Session
 
 from .database import get_db
 from .models import User, Message, Chat
-from .adk_geospatial_agents.main_agent.agent import process_user_message
+from .adk_geospatial_agents.main_agent.agent import (
+    process_user_message,
+    USER_STATE_MAXSIZE,
+    USER_STATE_TTL,
+)
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.invocation_context import InvocationContext
-from collections import defaultdict
+from cachetools import TTLCache
 
 # Global user state management (should be stored in Redis or DB in practice)
-user_states = defaultdict(lambda: {
-    "status": "idle",
-    "analysis_type": None,
-    "collected_params": {},
-    "conversation_context": []
-})
+# Bounded TTL cache so state for users who went idle is eventually evicted
+user_states = TTLCache(maxsize=USER_STATE_MAXSIZE, ttl=USER_STATE_TTL)
 
 # ADK agents are called directly through the process_user_message function
 
+@lru_cache(maxsize=1)
+def get_adk_runtime():
+    """Session service and placeholder agent shared by every request's InvocationContext"""
+    from google.adk.agents import Agent
+    from google.adk.sessions import InMemorySessionService
+    
+    return InMemorySessionService(), Agent(name="main_agent")
+
 def create_adk_context(user_id: int, chat_id: int):
     """Create CallbackContext according to ADK standards"""
     try:
         # Create InvocationContext according to ADK standards
         from google.adk.sessions import Session
-        from google.adk.agents import Agent
-        from google.adk.sessions import InMemorySessionService
         
         # Create Session
         session = Session(
@@ -43,11 +50,8 @@ def create_adk_context(user_id: int, chat_id: int):
             last_update_time=time.time()
         )
         
-        # Create SessionService
-        session_service = InMemorySessionService()
-        
-        # Create Agent
-        agent = Agent(name="main_agent")
+        # SessionService and Agent are built once and reused across requests
+        session_service, agent = get_adk_runtime()
         
         # Create InvocationContext
         invocation_context = InvocationContext(
@@ -2,9 +2,7 @@
 Infrastructure Analysis Agent Prompts
 """
 
-def get_infrastructure_agent_instruction() -> str:
-    """Return the infrastructure analysis agent's instructions."""
-    return """
+INFRASTRUCTURE_AGENT_INSTRUCTION = """
 You are a specialized infrastructure exposure analysis agent.
 
 Key roles:
@@ -35,3 +33,7 @@ Results provided:
 
 Always provide accurate and reliable analysis results.
 """
+
+def get_infrastructure_agent_instruction() -> str:
+    """Return the infrastructure analysis agent's instructions."""
+    return INFRASTRUCTURE_AGENT_INSTRUCTION
@@ -2,11 +2,14 @@
 Infrastructure Analysis Agent Tools
 """
 
+import logging
 from typing import Dict, Any
 from google.adk.tools import ToolContext
 
 from ..shared.tools.geospatial_tools import get_infrastructure_exposure_analysis
 
+logger = logging.getLogger(__name__)
+
 async def execute_infrastructure_analysis(
     year: int,
     threshold: float,
@@ -16,7 +19,7 @@ async def execute_infrastructure_analysis(
     tool_context: ToolContext = None
 ) -> Dict[str, Any]:
     """인프라 노출 분석을 실행합니다."""
-    print(f"🏗️ [Infrastructure Agent] Executing analysis: {city_name}, {country_name}, {year}, {threshold}m")
+    logger.debug("🏗️ [Infrastructure Agent] Executing analysis: %s, %s, %s, %sm", city_name, country_name, year, threshold)
     
     result = await get_infrastructure_exposure_analysis(
         year=year,
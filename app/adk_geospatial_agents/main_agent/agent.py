@@ -3,17 +3,22 @@ Main Coordinator Agent - ADK Standard
 """
 
 import os
-import asyncio
+import re
+import functools
+import logging
 from datetime import date
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-from collections import defaultdict
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from google.adk.agents import Agent
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools import load_artifacts
 from google.genai import types
 
-from .prompts import get_main_agent_instruction, get_global_instruction
+from .prompts import MAIN_AGENT_INSTRUCTION, GLOBAL_INSTRUCTION
 from .tools import (
     call_sea_level_agent,
     call_urban_agent, 
@@ -25,38 +30,115 @@ from .tools import (
 from ..shared.utils.parameter_collector import parameter_collector
 from ..shared.utils.bbox_utils import calculate_bbox, get_standard_buffer
 
+logger = logging.getLogger(__name__)
+
+# Per-user conversation state limits
+USER_STATE_MAXSIZE = 10_000
+USER_STATE_TTL = 3600  # seconds
+
+# 분석 유형별 표준 buffer (정적 매핑이므로 import 시 한 번만 계산)
+_BUFFERS = {k: get_standard_buffer(k) for k in
+            ("sea_level_rise", "urban_analysis", "infrastructure_analysis", "topic_modeling")}
+
+# 분석 유형별 안내 메시지 및 threshold가 필요한 분석 유형
+_ANALYSIS_NAMES = {
+    "sea_level_rise": "해수면 상승 위험 분석",
+    "urban_analysis": "도시 지역 분석",
+    "infrastructure_analysis": "인프라 노출 분석",
+    "topic_modeling": "토픽 모델링 분석"
+}
+_THRESHOLD_ANALYSES = frozenset({"sea_level_rise", "infrastructure_analysis", "urban_analysis"})
+# 정확히 매칭된 위치를 나타내는 파라미터 키
+_EXACT_LOCATION_KEYS = frozenset({"city_name", "country_name"})
+
+# Confirmation replies, matched per word token. Korean replies are also
+# matched as word prefixes so inflected forms (e.g. "좋아요", "틀렸어") count.
+_WORD_RE = re.compile(r"\w+")
+_POSITIVE_RESPONSES = frozenset({'yes', 'y', '응', '그래', '맞아', '맞다', '맞습니다', '네', '좋아', 'ok', 'okay'})
+_NEGATIVE_RESPONSES = frozenset({'no', 'n', '아니', '아니다', '아니요', '아닙니다', '틀렸', '다시', '취소'})
+_POSITIVE_PREFIXES = tuple(r for r in _POSITIVE_RESPONSES if not r.isascii())
+_NEGATIVE_PREFIXES = tuple(r for r in _NEGATIVE_RESPONSES if not r.isascii())
+
+# Fixed-schema reply templates (copied or merged per turn, never mutated)
+_COLLECTING_REPLY = MappingProxyType({"status": "collecting_parameters", "needs_clarification": True})
+_CONFIRMING_REPLY = MappingProxyType({"status": "awaiting_confirmation", "needs_clarification": True})
+_PARAM_ERROR_REPLY = MappingProxyType({
+    "message": "An error occurred during parameter collection. Please try again.",
+    "status": "error"
+})
+_WELCOME_REPLY = MappingProxyType({
+    "message": "Hello! I'm the DataGround geospatial analysis system. How can I help you with your analysis?\n\nSupported analyses:\n- Sea level rise risk analysis\n- Urban area analysis\n- Infrastructure exposure analysis\n- Topic modeling analysis",
+    "status": "general_chat"
+})
+_UNKNOWN_INTENT_REPLY = MappingProxyType({
+    "message": "Sorry, I couldn't understand your analysis intent. Please request a specific analysis.",
+    "status": "general_chat"
+})
+
 date_today = date.today()
 
+def _format_confirmation(collected: Dict[str, Any], analysis_type: str) -> str:
+    """Build the collected-parameters summary shown to the user"""
+    threshold = collected.get("threshold")
+    threshold = f"{threshold}m" if threshold not in (None, "None") else "None"
+    
+    # Display different information by analysis type
+    if analysis_type == "urban_analysis":
+        years = (f"Start Year: {collected.get('start_year', 'None')}\n"
+                 f"End Year: {collected.get('end_year', 'None')}\n")
+    else:
+        years = f"Year: {collected.get('year', 'None')}\n"
+    
+    return (f"Thank you! I've received the following information:\n"
+            f"Country: {collected.get('country_name', 'None')}\n"
+            f"City: {collected.get('city_name', 'None')}\n"
+            f"{years}"
+            f"Sea-level: {threshold}")
+
+def new_user_state() -> Dict[str, Any]:
+    """Return a fresh per-user conversation state"""
+    return {
+        "status": "idle",  # idle, collecting_parameters, awaiting_confirmation, analysis_in_progress
+        "analysis_type": None,
+        "collected_params": {},
+        "conversation_context": [],
+        "ambiguous_count": 0  # unclear replies in the current confirmation
+    }
+
 def setup_before_agent_call(callback_context: CallbackContext):
     """Setup before agent call"""
-    # Initialize user-specific state
+    # Initialize user-specific state (bounded so idle users are evicted)
     if "user_states" not in callback_context.state:
-        callback_context.state["user_states"] = defaultdict(lambda: {
-            "status": "idle",  # idle, collecting_parameters, awaiting_confirmation, analysis_in_progress
-            "analysis_type": None,
-            "collected_params": {},
-            "conversation_context": []
-        })
+        callback_context.state["user_states"] = TTLCache(maxsize=USER_STATE_MAXSIZE, ttl=USER_STATE_TTL)
     
     # Set current user ID (should be retrieved from request in practice)
     if "current_user_id" not in callback_context.state:
         callback_context.state["current_user_id"] = 1  # Default value
 
+def _is_response(tokens: set, responses: frozenset, prefixes: tuple) -> bool:
+    """Check whether any message token is one of the given replies"""
+    return not responses.isdisjoint(tokens) or any(token.startswith(prefixes) for token in tokens)
+
 async def process_user_message(message: str, user_id: int, callback_context: CallbackContext) -> Dict[str, Any]:
     """Main logic for processing user messages"""
     # Setup before ADK agent call
     setup_before_agent_call(callback_context)
     
     user_states = callback_context.state["user_states"]
-    user_state = user_states[user_id]
+    user_state = user_states.get(user_id)
+    if user_state is None:
+        user_state = new_user_state()
+    # Re-insert on every turn so active conversations keep their TTL fresh
+    user_states[user_id] = user_state
     
-    print(f"🚀 [Main Agent] Processing message from user {user_id}: '{message[:50]}...'")
+    logger.debug("🚀 [Main Agent] Processing message from user %s: '%.50s...'", user_id, message)
     
     # Check if new chat and initialize state
     is_new_chat = callback_context.state.get("is_new_chat", False)
     if is_new_chat:
-        print(f"🔄 [Main Agent] New chat detected, resetting user state")
+        logger.debug("🔄 [Main Agent] New chat detected, resetting user state")
         user_state["status"] = "idle"
+        user_state["ambiguous_count"] = 0
         user_state["analysis_type"] = None
         user_state["collected_params"] = {}
         user_state["conversation_context"] = []
@@ -81,59 +163,49 @@ async def process_user_message(message: str, user_id: int, callback_context: Cal
 
 async def handle_new_request(message: str, user_id: int, user_state: Dict[str, Any], callback_context: CallbackContext) -> Dict[str, Any]:
     """Handle new request"""
-    print(f"🔍 [Main Agent] Analyzing new request...")
+    logger.debug("🔍 [Main Agent] Analyzing new request...")
     
     # Detect analysis intent
     try:
         intent_result = await detect_analysis_intent(message, callback_context)
-        print(f"🔍 [Main Agent] Intent detection result: {intent_result}")
+        logger.debug("🔍 [Main Agent] Intent detection result: %s", intent_result)
         analysis_type = intent_result.get("intent")
         
-        print(f"🔍 [Main Agent] analysis_type value: '{analysis_type}' (type: {type(analysis_type)})")
-        print(f"🔍 [Main Agent] analysis_type is truthy: {bool(analysis_type)}")
-        
         if analysis_type:
-            print(f"📊 [Main Agent] Detected analysis type: {analysis_type}")
-            print(f"📊 [Main Agent] Entering analysis setup block...")
+            logger.debug("📊 [Main Agent] Detected analysis type: %s", analysis_type)
         else:
-            print(f"❌ [Main Agent] No analysis intent detected")
+            logger.debug("❌ [Main Agent] No analysis intent detected")
     except Exception as e:
-        print(f"❌ [Main Agent] Intent detection error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ [Main Agent] Intent detection error: %s", e)
         analysis_type = None
     
     # Only proceed with parameter collection if analysis_type exists
     if analysis_type:
-        print(f"🔧 [Main Agent] Setting up parameter collection for {analysis_type}...")
+        logger.debug("🔧 [Main Agent] Setting up parameter collection for %s...", analysis_type)
         
         # Start parameter collection
         user_state["status"] = "collecting_parameters"
+        user_state["ambiguous_count"] = 0
         user_state["analysis_type"] = analysis_type
         user_state["collected_params"] = {}
         
-        print(f"🔧 [Main Agent] User state updated: {user_state}")
+        logger.debug("🔧 [Main Agent] User state updated: %s", user_state)
         
         # Collect parameters
         try:
-            print(f"🔧 [Main Agent] Starting parameter collection...")
+            logger.debug("🔧 [Main Agent] Starting parameter collection...")
             param_result = await parameter_collector.collect_parameters(
                 message, analysis_type, user_state["collected_params"]
             )
-            print(f"🔧 [Main Agent] Parameter collection result: {param_result}")
+            logger.debug("🔧 [Main Agent] Parameter collection result: %s", param_result)
         except Exception as e:
-            print(f"❌ [Main Agent] Parameter collection error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "message": "An error occurred during parameter collection. Please try again.",
-                "status": "error"
-            }
+            logger.exception("❌ [Main Agent] Parameter collection error: %s", e)
+            return dict(_PARAM_ERROR_REPLY)
         
         if param_result["needs_more_info"]:
-            print(f"🔧 [Main Agent] More information needed, generating question...")
+            logger.debug("🔧 [Main Agent] More information needed, generating question...")
             missing_params = param_result["validation"]["missing"]
-            print(f"🔧 [Main Agent] Missing params: {missing_params}")
+            logger.debug("🔧 [Main Agent] Missing params: %s", missing_params)
             
             # Change order to ask Country first, then City
             if "country_name" in missing_params:
@@ -146,7 +218,7 @@ async def handle_new_request(message: str, user_id: int, user_state: Dict[str, A
                 question = parameter_collector.generate_questions([first_missing], analysis_type)
             
             response_message = f"Yes, I'll help you with {analysis_type.replace('_', ' ')} analysis! {question}"
-            print(f"🔧 [Main Agent] Generated response: {response_message}")
+            logger.debug("🔧 [Main Agent] Generated response: %s", response_message)
             
             # Add AI response to conversation context
             user_state["conversation_context"].append({
@@ -156,107 +228,71 @@ async def handle_new_request(message: str, user_id: int, user_state: Dict[str, A
             })
             
             return {
+                **_COLLECTING_REPLY,
                 "message": response_message,
-                "analysis_type": analysis_type,
-                "status": "collecting_parameters",
-                "needs_clarification": True
+                "analysis_type": analysis_type
             }
         else:
-            print(f"🔧 [Main Agent] All parameters collected, executing analysis...")
+            logger.debug("🔧 [Main Agent] All parameters collected, executing analysis...")
             # All parameters collected - execute analysis
             return await execute_analysis(analysis_type, param_result["params"], user_id, user_state, callback_context)
     else:
         # General conversation - show welcome message only for new chats
         is_new_chat = callback_context.state.get("is_new_chat", False)
-        print(f"🔍 [Main Agent] is_new_chat: {is_new_chat}")
+        logger.debug("🔍 [Main Agent] is_new_chat: %s", is_new_chat)
         
         if is_new_chat:
-            print(f"🔍 [Main Agent] Showing welcome message for new chat")
-            return {
-                "message": "Hello! I'm the DataGround geospatial analysis system. How can I help you with your analysis?\n\nSupported analyses:\n- Sea level rise risk analysis\n- Urban area analysis\n- Infrastructure exposure analysis\n- Topic modeling analysis",
-                "status": "general_chat"
-            }
+            logger.debug("🔍 [Main Agent] Showing welcome message for new chat")
+            return dict(_WELCOME_REPLY)
         else:
-            print(f"🔍 [Main Agent] Showing generic response for existing chat")
+            logger.debug("🔍 [Main Agent] Showing generic response for existing chat")
             # Simple response for existing chats
-            return {
-                "message": "Sorry, I couldn't understand your analysis intent. Please request a specific analysis.",
-                "status": "general_chat"
-            }
+            return dict(_UNKNOWN_INTENT_REPLY)
 
 async def handle_parameter_collection(message: str, user_id: int, user_state: Dict[str, Any], callback_context: CallbackContext) -> Dict[str, Any]:
     """Handle parameter collection"""
-    print(f"🔧 [Main Agent] Collecting parameters for {user_state['analysis_type']}...")
+    logger.debug("🔧 [Main Agent] Collecting parameters for %s...", user_state["analysis_type"])
     
     analysis_type = user_state["analysis_type"]
     existing_params = user_state["collected_params"]
     
-    # Collect parameters
+    # Collect parameters (bare year/threshold replies skip full extraction)
     try:
-        param_result = await parameter_collector.collect_parameters(
-            message, analysis_type, existing_params
-        )
-        print(f"🔧 [Main Agent] Parameter collection result: {param_result}")
+        param_result = parameter_collector.collect_simple_reply(message, analysis_type, existing_params)
+        if param_result is None:
+            param_result = await parameter_collector.collect_parameters(
+                message, analysis_type, existing_params
+            )
+        logger.debug("🔧 [Main Agent] Parameter collection result: %s", param_result)
     except Exception as e:
-        print(f"❌ [Main Agent] Parameter collection error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {
-            "message": "An error occurred during parameter collection. Please try again.",
-            "status": "error"
-        }
+        logger.exception("❌ [Main Agent] Parameter collection error: %s", e)
+        return dict(_PARAM_ERROR_REPLY)
     
     # Update collected parameters
     user_state["collected_params"] = param_result["params"]
     
     # If there's an exact match, ignore suggestion message and continue
-    has_exact_match = any(key in param_result["params"] for key in ["city_name", "country_name"])
+    has_exact_match = not _EXACT_LOCATION_KEYS.isdisjoint(param_result["params"])
     
     # Only process if there's a suggestion message and no exact match
     if not has_exact_match and "suggestion_message" in param_result["params"]:
         return {
+            **_COLLECTING_REPLY,
             "message": param_result["params"]["suggestion_message"],
             "analysis_type": analysis_type,
-            "status": "collecting_parameters",
-            "needs_clarification": True,
             "suggestion": True
         }
     
     # Generate confirmation message for collected information
-    collected = user_state["collected_params"]
-    country = collected.get("country_name", "None")
-    city = collected.get("city_name", "None") 
-    
-    confirmation_message = f"Thank you! I've received the following information:\n"
-    confirmation_message += f"Country: {country}\n"
-    confirmation_message += f"City: {city}\n"
-    
-    # Display different information by analysis type
-    if analysis_type == "urban_analysis":
-        start_year = collected.get("start_year", "None")
-        end_year = collected.get("end_year", "None")
-        threshold = collected.get("threshold", "None")
-        confirmation_message += f"Start Year: {start_year}\n"
-        confirmation_message += f"End Year: {end_year}\n"
-        if threshold != "None":
-            threshold = f"{threshold}m"
-        confirmation_message += f"Sea-level: {threshold}"
-    else:
-        year = collected.get("year", "None")
-        threshold = collected.get("threshold", "None")
-        confirmation_message += f"Year: {year}\n"
-        if threshold != "None":
-            threshold = f"{threshold}m"
-        confirmation_message += f"Sea-level: {threshold}"
+    confirmation_message = _format_confirmation(user_state["collected_params"], analysis_type)
     
     # Check if all parameters are collected
     all_collected = parameter_collector.are_all_parameters_collected(
         param_result["params"], analysis_type
     )
     
-    print(f"🔍 [Main Agent] Parameter collection check: all_collected={all_collected}")
-    print(f"🔍 [Main Agent] Current params: {param_result['params']}")
-    print(f"🔍 [Main Agent] Validation result: {param_result['validation']}")
+    logger.debug("🔍 [Main Agent] Parameter collection check: all_collected=%s, params=%s, validation=%s",
+                 all_collected, param_result["params"], param_result["validation"])
     
     if not all_collected:
         # Still missing parameters
@@ -272,94 +308,73 @@ async def handle_parameter_collection(message: str, user_id: int, user_state: Di
             question = parameter_collector.generate_questions([next_missing], analysis_type)
         
         return {
+            **_COLLECTING_REPLY,
             "message": f"{confirmation_message}\n\n{question}",
-            "analysis_type": analysis_type,
-            "status": "collecting_parameters",
-            "needs_clarification": True
+            "analysis_type": analysis_type
         }
     else:
         # All parameters collected - request user confirmation
-        print(f"✅ [Main Agent] All parameters collected, requesting user confirmation...")
+        logger.debug("✅ [Main Agent] All parameters collected, requesting user confirmation...")
         user_state["status"] = "awaiting_confirmation"  # Change to confirmation waiting state
+        user_state["ambiguous_count"] = 0
         
         return {
+            **_CONFIRMING_REPLY,
             "message": f"{confirmation_message}\n\nIs this information correct? (yes/no)",
-            "analysis_type": analysis_type,
-            "status": "awaiting_confirmation",
-            "needs_clarification": True
+            "analysis_type": analysis_type
         }
 
 async def handle_confirmation(message: str, user_id: int, user_state: Dict[str, Any], callback_context: CallbackContext) -> Dict[str, Any]:
     """Handle user confirmation"""
-    print(f"❓ [Main Agent] Handling user confirmation...")
+    logger.debug("❓ [Main Agent] Handling user confirmation...")
     
-    message_lower = message.lower().strip()
+    tokens = set(_WORD_RE.findall(message.lower()))
     
     # Check for positive response
-    positive_responses = ['yes', 'y', '응', '그래', '맞아', '맞다', '맞습니다', '네', '좋아', 'ok', 'okay']
-    negative_responses = ['no', 'n', '아니', '아니다', '아니요', '아닙니다', '틀렸', '다시', '취소']
-    
-    if any(response in message_lower for response in positive_responses):
+    if _is_response(tokens, _POSITIVE_RESPONSES, _POSITIVE_PREFIXES):
         # User confirmed - execute analysis
-        print(f"✅ [Main Agent] User confirmed, executing analysis...")
+        logger.debug("✅ [Main Agent] User confirmed, executing analysis...")
         user_state["status"] = "idle"  # Reset state
+        user_state["ambiguous_count"] = 0
         analysis_type = user_state["analysis_type"]
         collected_params = user_state["collected_params"]
         return await execute_analysis(analysis_type, collected_params, user_id, user_state, callback_context)
     
-    elif any(response in message_lower for response in negative_responses):
+    elif _is_response(tokens, _NEGATIVE_RESPONSES, _NEGATIVE_PREFIXES):
         # User rejected - start over from beginning
-        print(f"🔄 [Main Agent] User rejected, restarting parameter collection...")
+        logger.debug("🔄 [Main Agent] User rejected, restarting parameter collection...")
         user_state["status"] = "collecting_parameters"
         user_state["collected_params"] = {}  # Reset collected parameters
+        user_state["ambiguous_count"] = 0
         
         analysis_type = user_state["analysis_type"]
         return {
+            **_COLLECTING_REPLY,
             "message": f"Understood! I'll restart the {analysis_type.replace('_', ' ')} analysis. Which year would you like to analyze? (e.g., 2020, 2018)",
-            "analysis_type": analysis_type,
-            "status": "collecting_parameters",
-            "needs_clarification": True
+            "analysis_type": analysis_type
         }
     
     else:
-        # Unclear response - request confirmation again
-        collected = user_state["collected_params"]
-        country = collected.get("country_name", "None")
-        city = collected.get("city_name", "None")
-        analysis_type = user_state["analysis_type"]
-        
-        confirmation_message = f"Thank you! I've received the following information:\n"
-        confirmation_message += f"Country: {country}\n"
-        confirmation_message += f"City: {city}\n"
+        # Unclear response - short nudge, with the full summary every third time
+        user_state["ambiguous_count"] += 1
+        if user_state["ambiguous_count"] % 3:
+            return {
+                **_CONFIRMING_REPLY,
+                "message": "Please answer yes or no. (yes/no)",
+                "analysis_type": user_state["analysis_type"]
+            }
         
-        # Display different information by analysis type
-        if analysis_type == "urban_analysis":
-            start_year = collected.get("start_year", "None")
-            end_year = collected.get("end_year", "None")
-            threshold = collected.get("threshold", "None")
-            confirmation_message += f"Start Year: {start_year}\n"
-            confirmation_message += f"End Year: {end_year}\n"
-            if threshold != "None":
-                threshold = f"{threshold}m"
-            confirmation_message += f"Sea-level: {threshold}"
-        else:
-            year = collected.get("year", "None")
-            threshold = collected.get("threshold", "None")
-            confirmation_message += f"Year: {year}\n"
-            if threshold != "None":
-                threshold = f"{threshold}m"
-            confirmation_message += f"Sea-level: {threshold}"
+        confirmation_message = _format_confirmation(user_state["collected_params"], user_state["analysis_type"])
         
         return {
+            **_CONFIRMING_REPLY,
             "message": f"{confirmation_message}\n\nIs this information correct? (yes/no)",
-            "analysis_type": user_state["analysis_type"],
-            "status": "awaiting_confirmation",
-            "needs_clarification": True
+            "analysis_type": user_state["analysis_type"]
         }
 
 async def execute_analysis(analysis_type: str, params: Dict[str, Any], user_id: int, user_state: Dict[str, Any], callback_context: CallbackContext) -> Dict[str, Any]:
     """매개변수 수집 완료 후 자동으로 분석 실행"""
-    print(f"🚀 [Main Agent] Parameters collected for {analysis_type} analysis with params: {params}")
+    logger.debug("🚀 [Main Agent] Parameters collected for %s analysis with params: %s", analysis_type, params)
     
     # 매개변수를 수동 분석 시스템으로 전달하기 위한 URL 파라미터 생성
     # 각 분석 유형별로 필요한 파라미터만 포함
@@ -377,7 +392,7 @@ async def execute_analysis(analysis_type: str, params: Dict[str, Any], user_id:
         analysis_params["year1"] = params.get("year", "")
     
     # threshold가 필요한 분석 유형에만 추가
-    if analysis_type in ["sea_level_rise", "infrastructure_analysis", "urban_analysis"]:
+    if analysis_type in _THRESHOLD_ANALYSES:
         analysis_params["threshold"] = params.get("threshold", "")
     
     # topic_modeling의 경우 특별한 파라미터들 추가
@@ -394,14 +409,7 @@ async def execute_analysis(analysis_type: str, params: Dict[str, Any], user_id:
         })
     
     # 분석 유형별 안내 메시지
-    analysis_messages = {
-        "sea_level_rise": "해수면 상승 위험 분석",
-        "urban_analysis": "도시 지역 분석", 
-        "infrastructure_analysis": "인프라 노출 분석",
-        "topic_modeling": "토픽 모델링 분석"
-    }
-    
-    analysis_name = analysis_messages.get(analysis_type, analysis_type.replace('_', ' ').title())
+    analysis_name = _ANALYSIS_NAMES.get(analysis_type) or analysis_type.replace('_', ' ').title()
     
     # 자동 분석 실행을 위한 대시보드 업데이트 생성
     dashboard_updates = [{
@@ -441,77 +449,12 @@ async def execute_analysis(analysis_type: str, params: Dict[str, Any], user_id:
         "dashboard_updates": dashboard_updates
     }
 
-# Mock 분석 함수들 (실제 분석 로직 대신)
-async def mock_sea_level_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Mock 해수면 상승 분석"""
-    await asyncio.sleep(1)  # 분석 시뮬레이션
-    return {
-        "analysis_type": "sea_level_rise",
-        "results": {
-            "risk_level": "High",
-            "affected_area": "15.2 km²",
-            "population_at_risk": "45,000"
-        },
-        "dashboard_updates": [
-            {"type": "map", "data": "sea_level_risk_map"},
-            {"type": "chart", "data": "risk_distribution_chart"}
-        ]
-    }
-
-async def mock_urban_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Mock 도시 분석"""
-    await asyncio.sleep(1)  # 분석 시뮬레이션
-    return {
-        "analysis_type": "urban_analysis",
-        "results": {
-            "urban_growth_rate": "3.2%",
-            "population_density": "2,450/km²",
-            "built_up_area": "28.5 km²"
-        },
-        "dashboard_updates": [
-            {"type": "map", "data": "urban_expansion_map"},
-            {"type": "chart", "data": "growth_trends_chart"}
-        ]
-    }
-
-async def mock_infrastructure_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Mock 인프라 분석"""
-    await asyncio.sleep(1)  # 분석 시뮬레이션
-    return {
-        "analysis_type": "infrastructure_analysis",
-        "results": {
-            "exposed_infrastructure": "12 facilities",
-            "risk_score": "7.8/10",
-            "vulnerable_assets": "roads, bridges, power plants"
-        },
-        "dashboard_updates": [
-            {"type": "map", "data": "infrastructure_exposure_map"},
-            {"type": "chart", "data": "vulnerability_assessment_chart"}
-        ]
-    }
-
-async def mock_topic_modeling_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
-    """Mock 토픽 모델링 분석"""
-    await asyncio.sleep(1)  # 분석 시뮬레이션
-    return {
-        "analysis_type": "topic_modeling",
-        "results": {
-            "topics_found": 5,
-            "main_topics": ["climate change", "urban planning", "infrastructure", "risk assessment", "policy"],
-            "coherence_score": 0.85
-        },
-        "dashboard_updates": [
-            {"type": "chart", "data": "topic_distribution_chart"},
-            {"type": "table", "data": "topic_keywords_table"}
-        ]
-    }
-
 # ADK Agent 생성
 main_agent = Agent(
     model=os.getenv("MAIN_AGENT_MODEL", "gemini-2.0-flash-exp"),
     name="geospatial_analysis_coordinator",
-    instruction=get_main_agent_instruction(),
-    global_instruction=get_global_instruction(),
+    instruction=MAIN_AGENT_INSTRUCTION,
+    global_instruction=GLOBAL_INSTRUCTION,
     sub_agents=[],  # 서브 에이전트들은 tools를 통해 호출
     tools=[
         call_sea_level_agent,
@@ -526,52 +469,62 @@ main_agent = Agent(
     generate_content_config=types.GenerateContentConfig(temperature=0.01)
 )
 
+@functools.lru_cache(maxsize=512)
+def _cached_bbox(coordinate_items: tuple, buffer: float) -> Dict[str, float]:
+    """좌표/버퍼 조합별 bbox 계산 결과 캐시"""
+    return calculate_bbox(dict(coordinate_items), buffer)
+
+def _bbox_params(coordinates: Dict[str, Any], buffer: float) -> Dict[str, float]:
+    """캐시된 bbox의 복사본 반환 (호출 측에서 threshold 등을 추가해도 안전)"""
+    return dict(_cached_bbox(tuple(sorted(coordinates.items())), buffer))
+
+# 분석 API 서버 URL (FastAPI 서버)
+# 아래 call_*_api 함수들은 현재 호출하는 곳이 없으므로 공용 클라이언트 풀을 두지 않고 호출마다 클라이언트 생성
+_API_BASE_URL = "http://localhost:8000"
+
 # 실제 GEE API 호출 함수들
 async def call_sea_level_analysis_api(params: Dict[str, Any]) -> Dict[str, Any]:
     """Sea Level Rise 분석 API 호출"""
     try:
-        import httpx
-        
-        # API 엔드포인트 URL
-        base_url = "http://localhost:8000"  # FastAPI 서버 URL
+        # API 엔드포인트 (base URL은 _API_BASE_URL)
         endpoint = "/analysis/sea-level-rise"
         
         # 요청 파라미터 구성 (GET 요청)
         coordinates = params.get("coordinates", {})
-        buffer = get_standard_buffer("sea_level_rise")
-        bbox_params = calculate_bbox(coordinates, buffer)
+        buffer = _BUFFERS["sea_level_rise"]
+        bbox_params = _bbox_params(coordinates, buffer)
         bbox_params["threshold"] = params.get("threshold", 2.0)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{base_url}{endpoint}", params=bbox_params)
-            response.raise_for_status()
-            result = response.json()
-            
-            dashboard_updates = [
-                {
-                    "type": "map_update",
-                    "data": result.get("map_data", {}),
-                    "center": [params.get("coordinates", {}).get("lng", 0), 
-                             params.get("coordinates", {}).get("lat", 0)],
-                    "zoom": 10
-                },
-                {
-                    "type": "chart_update", 
-                    "data": result.get("chart_data", {}),
-                    "chart_type": "sea_level_rise"
-                }
-            ]
-            
-            print(f"🔍 [API Call] Sea Level Rise dashboard_updates created: {len(dashboard_updates)} items")
-            print(f"🔍 [API Call] Dashboard updates content: {dashboard_updates}")
-            
-            return {
-                "success": True,
-                "data": result,
-                "dashboard_updates": dashboard_updates
+        async with httpx.AsyncClient(base_url=_API_BASE_URL) as client:
+            response = await client.get(endpoint, params=bbox_params)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        dashboard_updates = [
+            {
+                "type": "map_update",
+                "data": result.get("map_data", {}),
+                "center": [params.get("coordinates", {}).get("lng", 0), 
+                         params.get("coordinates", {}).get("lat", 0)],
+                "zoom": 10
+            },
+            {
+                "type": "chart_update", 
+                "data": result.get("chart_data", {}),
+                "chart_type": "sea_level_rise"
             }
+        ]
+        
+        logger.debug("🔍 [API Call] Sea Level Rise dashboard_updates created: %d items: %s",
+                     len(dashboard_updates), dashboard_updates)
+        
+        return {
+            "success": True,
+            "data": result,
+            "dashboard_updates": dashboard_updates
+        }
     except Exception as e:
-        print(f"❌ [API Call] Sea Level Rise API error: {e}")
+        logger.error("❌ [API Call] Sea Level Rise API error: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -581,41 +534,38 @@ async def call_sea_level_analysis_api(params: Dict[str, Any]) -> Dict[str, Any]:
 async def call_urban_analysis_api(params: Dict[str, Any]) -> Dict[str, Any]:
     """Urban Analysis API 호출"""
     try:
-        import httpx
-        
-        base_url = "http://localhost:8000"
         endpoint = "/analysis/urban-area-comprehensive-stats"
         
         # 요청 파라미터 구성 (GET 요청)
         coordinates = params.get("coordinates", {})
-        buffer = get_standard_buffer("urban_analysis")
-        bbox_params = calculate_bbox(coordinates, buffer)
+        buffer = _BUFFERS["urban_analysis"]
+        bbox_params = _bbox_params(coordinates, buffer)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{base_url}{endpoint}", params=bbox_params)
-            response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": True,
-                "data": result,
-                "dashboard_updates": [
-                    {
-                        "type": "map_update",
-                        "data": result.get("map_data", {}),
-                        "center": [params.get("coordinates", {}).get("lng", 0), 
-                                 params.get("coordinates", {}).get("lat", 0)],
-                        "zoom": 10
-                    },
-                    {
-                        "type": "chart_update",
-                        "data": result.get("chart_data", {}),
-                        "chart_type": "urban_analysis"
-                    }
-                ]
-            }
+        async with httpx.AsyncClient(base_url=_API_BASE_URL) as client:
+            response = await client.get(endpoint, params=bbox_params)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        return {
+            "success": True,
+            "data": result,
+            "dashboard_updates": [
+                {
+                    "type": "map_update",
+                    "data": result.get("map_data", {}),
+                    "center": [params.get("coordinates", {}).get("lng", 0), 
+                             params.get("coordinates", {}).get("lat", 0)],
+                    "zoom": 10
+                },
+                {
+                    "type": "chart_update",
+                    "data": result.get("chart_data", {}),
+                    "chart_type": "urban_analysis"
+                }
+            ]
+        }
     except Exception as e:
-        print(f"❌ [API Call] Urban Analysis API error: {e}")
+        logger.error("❌ [API Call] Urban Analysis API error: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -625,41 +575,38 @@ async def call_urban_analysis_api(params: Dict[str, Any]) -> Dict[str, Any]:
 async def call_infrastructure_analysis_api(params: Dict[str, Any]) -> Dict[str, Any]:
     """Infrastructure Analysis API 호출"""
     try:
-        import httpx
-        
-        base_url = "http://localhost:8000"
         endpoint = "/analysis/infrastructure-exposure"
         
         # 요청 파라미터 구성 (GET 요청)
         coordinates = params.get("coordinates", {})
-        buffer = get_standard_buffer("infrastructure_analysis")
-        bbox_params = calculate_bbox(coordinates, buffer)
+        buffer = _BUFFERS["infrastructure_analysis"]
+        bbox_params = _bbox_params(coordinates, buffer)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{base_url}{endpoint}", params=bbox_params)
-            response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": True,
-                "data": result,
-                "dashboard_updates": [
-                    {
-                        "type": "map_update",
-                        "data": result.get("map_data", {}),
-                        "center": [params.get("coordinates", {}).get("lng", 0), 
-                                 params.get("coordinates", {}).get("lat", 0)],
-                        "zoom": 10
-                    },
-                    {
-                        "type": "chart_update",
-                        "data": result.get("chart_data", {}),
-                        "chart_type": "infrastructure_exposure"
-                    }
-                ]
-            }
+        async with httpx.AsyncClient(base_url=_API_BASE_URL) as client:
+            response = await client.get(endpoint, params=bbox_params)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        return {
+            "success": True,
+            "data": result,
+            "dashboard_updates": [
+                {
+                    "type": "map_update",
+                    "data": result.get("map_data", {}),
+                    "center": [params.get("coordinates", {}).get("lng", 0), 
+                             params.get("coordinates", {}).get("lat", 0)],
+                    "zoom": 10
+                },
+                {
+                    "type": "chart_update",
+                    "data": result.get("chart_data", {}),
+                    "chart_type": "infrastructure_exposure"
+                }
+            ]
+        }
     except Exception as e:
-        print(f"❌ [API Call] Infrastructure Analysis API error: {e}")
+        logger.error("❌ [API Call] Infrastructure Analysis API error: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -669,9 +616,6 @@ async def call_infrastructure_analysis_api(params: Dict[str, Any]) -> Dict[str,
 async def call_topic_modeling_api(params: Dict[str, Any]) -> Dict[str, Any]:
     """Topic Modeling API 호출"""
     try:
-        import httpx
-        
-        base_url = "http://localhost:8000"
         endpoint = "/analysis/topic-modeling"
         
         # 요청 데이터 구성 (POST 요청)
@@ -681,24 +625,24 @@ async def call_topic_modeling_api(params: Dict[str, Any]) -> Dict[str, Any]:
             "topics": params.get("topics", 5)
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{base_url}{endpoint}", json=request_data)
-            response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": True,
-                "data": result,
-                "dashboard_updates": [
-                    {
-                        "type": "chart_update",
-                        "data": result.get("chart_data", {}),
-                        "chart_type": "topic_modeling"
-                    }
-                ]
-            }
+        async with httpx.AsyncClient(base_url=_API_BASE_URL) as client:
+            response = await client.post(endpoint, json=request_data)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        return {
+            "success": True,
+            "data": result,
+            "dashboard_updates": [
+                {
+                    "type": "chart_update",
+                    "data": result.get("chart_data", {}),
+                    "chart_type": "topic_modeling"
+                }
+            ]
+        }
     except Exception as e:
-        print(f"❌ [API Call] Topic Modeling API error: {e}")
+        logger.error("❌ [API Call] Topic Modeling API error: %s", e)
         return {
             "success": False,
             "error": str(e),
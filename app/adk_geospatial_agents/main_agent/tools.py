@@ -2,8 +2,13 @@
 Main Agent Tools
 """
 
+import logging
 import os
-from typing import Dict, Any
+import re
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Optional
+
 from google.adk.tools import ToolContext
 from google.adk.tools.agent_tool import AgentTool
 
@@ -13,14 +18,71 @@ from ..infrastructure_agent.agent import infrastructure_agent
 from ..topic_modeling_agent.agent import topic_modeling_agent
 from ..shared.utils.parameter_collector import parameter_collector
 
+logger = logging.getLogger(__name__)
+
+# Sub-agent tools are stateless across run_async calls, so build them once
+_SEA_TOOL = AgentTool(agent=sea_level_agent)
+_URBAN_TOOL = AgentTool(agent=urban_agent)
+_INFRA_TOOL = AgentTool(agent=infrastructure_agent)
+_TOPIC_TOOL = AgentTool(agent=topic_modeling_agent)
+
+# Intent keywords, in priority order (earlier intents win when several match)
+# Sea level rise related keywords
+SEA_LEVEL_KEYWORDS = (
+    "sea level", "slr", "해수면", "해수면 상승", "sea level rise", 
+    "해수면 상승 위험", "해수면 상승 분석", "해수면 상승 위험 분석"
+)
+
+# Urban analysis related keywords
+URBAN_KEYWORDS = (
+    "urban", "도시", "도시지역", "도시 분석", "도시 지역 분석",
+    "urban analysis", "도시 확장", "도시화"
+)
+
+# Infrastructure analysis related keywords
+INFRASTRUCTURE_KEYWORDS = (
+    "infrastructure", "인프라", "인프라 노출", "인프라 분석",
+    "infrastructure exposure", "인프라 노출 분석"
+)
+
+# Topic modeling related keywords
+TOPIC_MODELING_KEYWORDS = (
+    "topic modeling", "토픽", "토픽 모델링", "토픽 분석",
+    "topic analysis", "텍스트 분석"
+)
+
+# Intents in priority order (this order decides ties, so it is fixed rather than
+# tuned to traffic). Keywords are matched as substrings, so longer keywords that
+# contain a shorter one (e.g. "해수면 상승" vs "해수면") never change the result;
+# they are kept anyway so a later switch to token or word-boundary matching stays correct.
+_INTENT_KEYWORDS = (
+    ("sea_level_rise", SEA_LEVEL_KEYWORDS),
+    ("urban_analysis", URBAN_KEYWORDS),
+    ("infrastructure_analysis", INFRASTRUCTURE_KEYWORDS),
+    ("topic_modeling", TOPIC_MODELING_KEYWORDS),
+)
+
+# One compiled alternation per intent, searched in priority order
+_INTENT_PATTERNS = [
+    (intent, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+    for intent, keywords in _INTENT_KEYWORDS
+]
+
+# Read-only intent result templates; detect_analysis_intent returns copies
+_RESULTS = {
+    intent: MappingProxyType({"intent": intent, "confidence": 0.9})
+    for intent, _ in _INTENT_KEYWORDS
+}
+_NO_MATCH = MappingProxyType({"intent": None, "confidence": 0.0})
+
 async def call_sea_level_agent(
     request: str,
     tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Call sea level rise analysis agent."""
-    print(f"🌊 [Main Agent] Calling sea level agent with: {request}")
+    logger.debug("🌊 [Main Agent] Calling sea level agent with: %s", request)
     
-    agent_tool = AgentTool(agent=sea_level_agent)
+    agent_tool = _SEA_TOOL
     result = await agent_tool.run_async(
         args={"request": request},
         tool_context=tool_context
@@ -33,9 +95,9 @@ async def call_urban_agent(
     tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Call urban analysis agent."""
-    print(f"🏙️ [Main Agent] Calling urban agent with: {request}")
+    logger.debug("🏙️ [Main Agent] Calling urban agent with: %s", request)
     
-    agent_tool = AgentTool(agent=urban_agent)
+    agent_tool = _URBAN_TOOL
     result = await agent_tool.run_async(
         args={"request": request},
         tool_context=tool_context
@@ -48,9 +110,9 @@ async def call_infrastructure_agent(
     tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Call infrastructure analysis agent."""
-    print(f"🏗️ [Main Agent] Calling infrastructure agent with: {request}")
+    logger.debug("🏗️ [Main Agent] Calling infrastructure agent with: %s", request)
     
-    agent_tool = AgentTool(agent=infrastructure_agent)
+    agent_tool = _INFRA_TOOL
     result = await agent_tool.run_async(
         args={"request": request},
         tool_context=tool_context
@@ -63,9 +125,9 @@ async def call_topic_modeling_agent(
     tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Call topic modeling agent."""
-    print(f"📊 [Main Agent] Calling topic modeling agent with: {request}")
+    logger.debug("📊 [Main Agent] Calling topic modeling agent with: %s", request)
     
-    agent_tool = AgentTool(agent=topic_modeling_agent)
+    agent_tool = _TOPIC_TOOL
     result = await agent_tool.run_async(
         args={"request": request},
         tool_context=tool_context
@@ -79,63 +141,44 @@ async def collect_parameters(
     tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Perform parameter collection."""
-    print(f"🔧 [Main Agent] Collecting parameters for {analysis_type}")
+    logger.debug("🔧 [Main Agent] Collecting parameters for %s", analysis_type)
     
     # Get existing parameters
     existing_params = tool_context.state.get("collected_params", {})
     
     # Collect parameters
-    result = parameter_collector.collect_parameters(
+    result = await parameter_collector.collect_parameters(
         message, analysis_type, existing_params
     )
     
-    # Update state
+    # Update state: result["params"] may be existing_params itself when nothing new was
+    # extracted, so always assign it back - the assignment is what records the state delta
     tool_context.state["collected_params"] = result["params"]
     tool_context.state["analysis_type"] = analysis_type
     
     return result
 
+@functools.lru_cache(maxsize=4096)
+def _detect(message: str) -> Optional[str]:
+    """Return the highest-priority intent for a message (memoized by raw message)."""
+    message_lower = message.lower()
+    
+    # Keyword matching: the first intent (in priority order) with a hit wins
+    for intent, pattern in _INTENT_PATTERNS:
+        if pattern.search(message_lower):
+            return intent
+    
+    return None
+
 async def detect_analysis_intent(
     message: str,
     callback_context
 ) -> Dict[str, Any]:
     """Detect analysis intent."""
-    print(f"🔍 [Main Agent] Detecting analysis intent for: {message}")
+    logger.debug("🔍 [Main Agent] Detecting analysis intent for: %s", message)
     
-    message_lower = message.lower()
+    intent = _detect(message)
+    if intent is not None:
+        return dict(_RESULTS[intent])
     
-    # Sea level rise related keywords
-    sea_level_keywords = [
-        "sea level", "slr", "해수면", "해수면 상승", "sea level rise", 
-        "해수면 상승 위험", "해수면 상승 분석", "해수면 상승 위험 분석"
-    ]
-    
-    # Urban analysis related keywords
-    urban_keywords = [
-        "urban", "도시", "도시지역", "도시 분석", "도시 지역 분석",
-        "urban analysis", "도시 확장", "도시화"
-    ]
-    
-    # Infrastructure analysis related keywords
-    infrastructure_keywords = [
-        "infrastructure", "인프라", "인프라 노출", "인프라 분석",
-        "infrastructure exposure", "인프라 노출 분석"
-    ]
-    
-    # Topic modeling related keywords
-    topic_modeling_keywords = [
-        "topic modeling", "토픽", "토픽 모델링", "토픽 분석",
-        "topic analysis", "텍스트 분석"
-    ]
-    
-    # Keyword matching
-    if any(keyword in message_lower for keyword in sea_level_keywords):
-        return {"intent": "sea_level_rise", "confidence": 0.9}
-    elif any(keyword in message_lower for keyword in urban_keywords):
-        return {"intent": "urban_analysis", "confidence": 0.9}
-    elif any(keyword in message_lower for keyword in infrastructure_keywords):
-        return {"intent": "infrastructure_analysis", "confidence": 0.9}
-    elif any(keyword in message_lower for keyword in topic_modeling_keywords):
-        return {"intent": "topic_modeling", "confidence": 0.9}
-    
-    return {"intent": None, "confidence": 0.0}
+    return dict(_NO_MATCH)
@@ -2,9 +2,7 @@
 Sea Level Rise Agent Prompts
 """
 
-def get_sea_level_agent_instruction() -> str:
-    """Return the sea level rise analysis agent's instructions."""
-    return """
+SEA_LEVEL_AGENT_INSTRUCTION = """
 You are a specialized sea level rise risk analysis agent.
 
 Key roles:
@@ -34,3 +32,7 @@ Results provided:
 
 Always provide accurate and reliable analysis results.
 """
+
+def get_sea_level_agent_instruction() -> str:
+    """Return the sea level rise analysis agent's instructions."""
+    return SEA_LEVEL_AGENT_INSTRUCTION
@@ -2,11 +2,14 @@
 Sea Level Rise Agent Tools
 """
 
+import logging
 from typing import Dict, Any
 from google.adk.tools import ToolContext
 
 from ..shared.tools.geospatial_tools import get_sea_level_risk_analysis
 
+logger = logging.getLogger(__name__)
+
 async def execute_sea_level_analysis(
     year: int,
     threshold: float,
@@ -16,7 +19,7 @@ async def execute_sea_level_analysis(
     tool_context: ToolContext = None
 ) -> Dict[str, Any]:
     """해수면 상승 위험 분석을 실행합니다."""
-    print(f"🌊 [Sea Level Agent] Executing analysis: {city_name}, {country_name}, {year}, {threshold}m")
+    logger.debug("🌊 [Sea Level Agent] Executing analysis: %s, %s, %s, %sm", city_name, country_name, year, threshold)
     
     result = await get_sea_level_risk_analysis(
         year=year,
@@ -3,56 +3,100 @@ ADK Geospatial Analysis Tools
 """
 
 import os
-import requests
+import asyncio
+import httpx
+import orjson
 from typing import Dict, Any, Optional
+from cachetools import TTLCache
 from google.adk.tools import ToolContext
 
 # GEE API endpoint
 GEE_API_BASE = "http://localhost:8000/api/analysis"
 
-async def get_sea_level_risk_analysis(
-    year: int,
-    threshold: float,
-    city_name: str,
-    country_name: str,
-    coordinates: Optional[Dict[str, float]] = None,
-    tool_context: ToolContext = None
-) -> Dict[str, Any]:
-    """
-    Performs sea level rise risk analysis.
+# Endpoint paths, relative to GEE_API_BASE
+_URL_SLR = "/sea-level-rise-risk"
+_URL_URBAN = "/urban-area-comprehensive"
+_URL_INFRA = "/infrastructure-exposure"
+_URL_TOPIC = "/topic-modeling"
+
+# Shared keep-alive client for all analysis calls
+_HTTP = httpx.AsyncClient(
+    base_url=GEE_API_BASE,
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+
+async def close_http_client() -> None:
+    """Close the shared analysis client (called on app shutdown)."""
+    await _HTTP.aclose()
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Raw analysis responses keyed by (endpoint, payload); identical requests reuse the response.
+# Bytes are stored and parsed per caller, so callers never share (and mutate) one result dict.
+_RESULT_CACHE = TTLCache(maxsize=256, ttl=3600)
+
+# Requests currently in flight; concurrent duplicates await the same future (resolving to bytes)
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+class _LeaderCancelled(Exception):
+    """Set on an in-flight future when the request that owns it is cancelled."""
+
+async def _post_analysis(url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """POST to the analysis API, reusing a cached or in-flight result for identical payloads."""
+    key = (url, tuple(sorted(payload.items())))
+    content = _RESULT_CACHE.get(key)
+    if content is not None:
+        return orjson.loads(content)
     
-    Args:
-        year: Analysis year (2000-2024)
-        threshold: Sea level rise threshold (0.5-5.0m)
-        city_name: City name
-        country_name: Country name
-        coordinates: Coordinate information (lat, lng)
-        tool_context: ADK tool context
+    while (future := _INFLIGHT.get(key)) is not None:
+        try:
+            return orjson.loads(await asyncio.shield(future))
+        except _LeaderCancelled:
+            # The request we were waiting on was cancelled, not failed; issue it ourselves
+            pass
     
-    Returns:
-        Analysis result dictionary
-    """
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
     try:
-        url = f"{GEE_API_BASE}/sea-level-rise-risk"
-        payload = {
-            "year": year,
-            "threshold": threshold,
-            "city_name": city_name,
-            "country_name": country_name
-        }
-        
-        if coordinates:
-            payload.update(coordinates)
-        
-        response = requests.post(url, json=payload, timeout=30)
+        response = await _HTTP.post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
         response.raise_for_status()
+        content = response.content
+        result = orjson.loads(content)
+        _RESULT_CACHE[key] = content
+        future.set_result(content)
+        return result
+    except asyncio.CancelledError:
+        # Only this caller was cancelled; let followers retry instead of cancelling them too
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Followers re-raise it; mark it retrieved in case there are none
+        future.exception()
+        raise
+    finally:
+        _INFLIGHT.pop(key, None)
+
+async def _run_analysis(
+    url: str,
+    payload: Dict[str, Any],
+    update_type: str,
+    message: str,
+    error_label: str
+) -> Dict[str, Any]:
+    """Call an analysis endpoint and wrap the result with dashboard updates."""
+    try:
+        result = await _post_analysis(url, payload)
         
-        result = response.json()
+        # The endpoints return their payload at the top level (url, map_data, chart_data, ...),
+        # so the whole parsed body is passed through rather than a data/visualization subset
         
         # Add dashboard update information
         dashboard_updates = [
             {
-                "type": "sea_level_risk",
+                "type": update_type,
                 "data": result.get("data", {}),
                 "visualization": result.get("visualization", {})
             }
@@ -60,7 +104,7 @@ async def get_sea_level_risk_analysis(
         
         return {
             "status": "completed",
-            "message": f"Sea level rise risk analysis completed. ({city_name}, {country_name}, {year}, {threshold}m)",
+            "message": message,
             "data": result,
             "dashboard_updates": dashboard_updates
         }
@@ -68,9 +112,47 @@ async def get_sea_level_risk_analysis(
     except Exception as e:
         return {
             "status": "failed",
-            "message": f"Error occurred during sea level rise risk analysis: {str(e)}"
+            "message": f"Error occurred during {error_label}: {str(e)}"
         }
 
+async def get_sea_level_risk_analysis(
+    year: int,
+    threshold: float,
+    city_name: str,
+    country_name: str,
+    coordinates: Optional[Dict[str, float]] = None,
+    tool_context: ToolContext = None
+) -> Dict[str, Any]:
+    """
+    Performs sea level rise risk analysis.
+    
+    Args:
+        year: Analysis year (2000-2024)
+        threshold: Sea level rise threshold (0.5-5.0m)
+        city_name: City name
+        country_name: Country name
+        coordinates: Coordinate information (lat, lng)
+        tool_context: ADK tool context
+    
+    Returns:
+        Analysis result dictionary
+    """
+    payload = {
+        "year": year,
+        "threshold": threshold,
+        "city_name": city_name,
+        "country_name": country_name,
+        **(coordinates or {})
+    }
+    
+    return await _run_analysis(
+        _URL_SLR,
+        payload,
+        "sea_level_risk",
+        f"Sea level rise risk analysis completed. ({city_name}, {country_name}, {year}, {threshold}m)",
+        "sea level rise risk analysis"
+    )
+
 async def get_urban_area_analysis(
     year: int,
     city_name: str,
@@ -91,43 +173,20 @@ async def get_urban_area_analysis(
     Returns:
         Analysis result dictionary
     """
-    try:
-        url = f"{GEE_API_BASE}/urban-area-comprehensive"
-        payload = {
-            "year": year,
-            "city_name": city_name,
-            "country_name": country_name
-        }
-        
-        if coordinates:
-            payload.update(coordinates)
-        
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        
-        # Add dashboard update information
-        dashboard_updates = [
-            {
-                "type": "urban_analysis",
-                "data": result.get("data", {}),
-                "visualization": result.get("visualization", {})
-            }
-        ]
-        
-        return {
-            "status": "completed",
-            "message": f"Urban area analysis completed. ({city_name}, {country_name}, {year})",
-            "data": result,
-            "dashboard_updates": dashboard_updates
-        }
-        
-    except Exception as e:
-        return {
-            "status": "failed",
-            "message": f"Error occurred during urban area analysis: {str(e)}"
-        }
+    payload = {
+        "year": year,
+        "city_name": city_name,
+        "country_name": country_name,
+        **(coordinates or {})
+    }
+    
+    return await _run_analysis(
+        _URL_URBAN,
+        payload,
+        "urban_analysis",
+        f"Urban area analysis completed. ({city_name}, {country_name}, {year})",
+        "urban area analysis"
+    )
 
 async def get_infrastructure_exposure_analysis(
     year: int,
@@ -151,44 +210,21 @@ async def get_infrastructure_exposure_analysis(
     Returns:
         Analysis result dictionary
     """
-    try:
-        url = f"{GEE_API_BASE}/infrastructure-exposure"
-        payload = {
-            "year": year,
-            "threshold": threshold,
-            "city_name": city_name,
-            "country_name": country_name
-        }
-        
-        if coordinates:
-            payload.update(coordinates)
-        
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        
-        # Add dashboard update information
-        dashboard_updates = [
-            {
-                "type": "infrastructure_exposure",
-                "data": result.get("data", {}),
-                "visualization": result.get("visualization", {})
-            }
-        ]
-        
-        return {
-            "status": "completed",
-            "message": f"Infrastructure exposure analysis completed. ({city_name}, {country_name}, {year}, {threshold}m)",
-            "data": result,
-            "dashboard_updates": dashboard_updates
-        }
-        
-    except Exception as e:
-        return {
-            "status": "failed",
-            "message": f"Error occurred during infrastructure exposure analysis: {str(e)}"
-        }
+    payload = {
+        "year": year,
+        "threshold": threshold,
+        "city_name": city_name,
+        "country_name": country_name,
+        **(coordinates or {})
+    }
+    
+    return await _run_analysis(
+        _URL_INFRA,
+        payload,
+        "infrastructure_exposure",
+        f"Infrastructure exposure analysis completed. ({city_name}, {country_name}, {year}, {threshold}m)",
+        "infrastructure exposure analysis"
+    )
 
 async def get_topic_modeling_analysis(
     method: str = "lda",
@@ -206,36 +242,15 @@ async def get_topic_modeling_analysis(
     Returns:
         Analysis result dictionary
     """
-    try:
-        url = f"{GEE_API_BASE}/topic-modeling"
-        payload = {
-            "method": method,
-            "n_topics": n_topics
-        }
-        
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        
-        # Add dashboard update information
-        dashboard_updates = [
-            {
-                "type": "topic_modeling",
-                "data": result.get("data", {}),
-                "visualization": result.get("visualization", {})
-            }
-        ]
-        
-        return {
-            "status": "completed",
-            "message": f"Topic modeling analysis completed. ({method}, {n_topics} topics)",
-            "data": result,
-            "dashboard_updates": dashboard_updates
-        }
-        
-    except Exception as e:
-        return {
-            "status": "failed",
-            "message": f"Error occurred during topic modeling analysis: {str(e)}"
-        }
+    payload = {
+        "method": method,
+        "n_topics": n_topics
+    }
+    
+    return await _run_analysis(
+        _URL_TOPIC,
+        payload,
+        "topic_modeling",
+        f"Topic modeling analysis completed. ({method}, {n_topics} topics)",
+        "topic modeling analysis"
+    )
@@ -0,0 +1,62 @@
+"""
+Numba fuzzy-match kernel - rapidfuzz가 설치되지 않은 환경용 fallback
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numba import njit, prange
+
+def encode_candidates(candidates: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """후보 문자열을 (N, maxlen) 코드포인트 행렬과 길이 배열로 변환"""
+    lens = np.fromiter((len(c) for c in candidates), dtype=np.int32, count=len(candidates))
+    width = int(lens.max()) if len(candidates) else 1
+    codes = np.zeros((len(candidates), max(width, 1)), dtype=np.int32)
+    for i, candidate in enumerate(candidates):
+        if candidate:
+            codes[i, :len(candidate)] = np.frombuffer(candidate.encode("utf-32-le"), dtype=np.int32)
+    return codes, lens
+
+@njit(cache=True)
+def _indel_ratio(query, query_len, cand, cand_len):
+    """fuzz.ratio 와 같은 정규화 Indel 유사도 (2 * LCS / 길이 합)"""
+    total = query_len + cand_len
+    if total == 0:
+        return 1.0
+    prev = np.zeros(cand_len + 1, dtype=np.int32)
+    cur = np.zeros(cand_len + 1, dtype=np.int32)
+    for i in range(query_len):
+        qc = query[i]
+        for j in range(cand_len):
+            if qc == cand[j]:
+                cur[j + 1] = prev[j] + 1
+            elif prev[j + 1] >= cur[j]:
+                cur[j + 1] = prev[j + 1]
+            else:
+                cur[j + 1] = cur[j]
+        prev, cur = cur, prev
+    return 2.0 * prev[cand_len] / total
+
+@njit(cache=True, parallel=True)
+def _ratios(query, query_len, codes, lens):
+    out = np.empty(codes.shape[0], dtype=np.float64)
+    for i in prange(codes.shape[0]):
+        out[i] = _indel_ratio(query, query_len, codes[i], lens[i])
+    return out
+
+def extract_one(
+    query: str,
+    candidates: List[str],
+    encoded: Tuple[np.ndarray, np.ndarray],
+    threshold: float
+) -> Tuple[Optional[str], float]:
+    """threshold 이상인 후보 중 가장 유사한 것 반환 (동점이면 앞쪽 후보)"""
+    codes, lens = encoded
+    if not candidates:
+        return None, 0.0
+    q = np.frombuffer(query.encode("utf-32-le"), dtype=np.int32) if query else np.zeros(0, dtype=np.int32)
+    scores = _ratios(q, len(query), codes, lens)
+    best = int(np.argmax(scores))
+    if scores[best] < threshold:
+        return None, 0.0
+    return candidates[best], float(scores[best])
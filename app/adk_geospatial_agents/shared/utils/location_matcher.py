@@ -2,11 +2,73 @@
 Location Matcher - 개선된 버전
 """
 
+import contextlib
+import logging
+import os
+import pickle
+import tempfile
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
-import difflib
+from typing import Dict, Any, List, Optional, Tuple
+try:
+    from rapidfuzz import fuzz, process
+    _fuzzy_kernel = None
+except ImportError:
+    # rapidfuzz가 없으면 numba 커널로 유사도 계산
+    fuzz = process = None
+    try:
+        from . import _fuzzy_kernel
+    except ImportError:
+        raise ImportError("rapidfuzz (or numba for the fallback kernel) package required for LocationMatcher")
 import re
+import sys
+from bisect import bisect_left
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# 부정적 응답 접두어
+_NEGATIVE_PREFIXES = ("no,", "아니", "아니요", "아니다")
+
+# 위치 정보가 아닌 일반적인 단어들
+_NON_LOCATION_WORDS = frozenset(sys.intern(word) for word in (
+    '해수면', '상승', '분석', '위험', '도시', '지역', '인프라', '노출', 
+    '토픽', '모델링', 'year', '년', '미터', 'meter', 'm', 'threshold',
+    'yes', 'no', '응', '아니', '맞아', '맞다', 'ok', 'okay'
+))
+
+# 쉼표 구분 (주변 공백 포함)
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# 국가명 특별 매핑
+_SPECIAL_COUNTRY_MAPPINGS = MappingProxyType({
+    "south korea": "korea, south",
+    "north korea": "korea, north",
+    "united states": "united states of america",
+    "usa": "united states of america",
+    "uk": "united kingdom",
+    "united kingdom": "united kingdom"
+})
+
+# worldcities.csv 에서 사용하는 열과 타입 (lat/lng는 JSON 직렬화를 위해 float64 유지)
+_CSV_COLUMNS = ['city', 'country', 'lat', 'lng']
+_CSV_DTYPES = {'city': 'string', 'country': 'category'}
+
+# 인덱스 캐시 (worldcities.csv 옆에 저장, CSV가 바뀌면 다시 생성)
+_INDEX_CACHE_SUFFIX = ".idx.pkl"
+_INDEX_CACHE_VERSION = 1
+_INDEX_CACHE_FIELDS = (
+    "cities_df", "countries", "_cities_lower", "_countries_lower",
+    "_city_index", "_country_info", "_city_names_sorted",
+    "_coords", "_city_names", "_country_names", "_cities_arr", "_city_lens"
+)
+
+# 접두어 후보가 이보다 적으면 전체 목록으로 유사도 검색
+_PREFIX_MIN_CANDIDATES = 20
+
+def _norm(text: str) -> str:
+    """검색용 정규화 (공백 제거 후 소문자)"""
+    return text.strip().lower()
 
 class LocationMatcher:
     """위치 매칭을 위한 클래스"""
@@ -15,136 +77,267 @@ class LocationMatcher:
         self.csv_path = csv_path
         self.cities_df = None
         self.countries = set()
+        self._cities_lower: List[str] = []
+        self._countries_lower: List[str] = []
+        self._city_index: Dict[str, int] = {}
+        self._country_info: Dict[str, Tuple[str, np.ndarray]] = {}
+        self._city_names_sorted: List[str] = []
+        self._cities_arr: np.ndarray = np.empty(0, dtype=object)
+        self._city_lens: np.ndarray = np.empty(0, dtype=np.int16)
+        self._encoded: Dict[int, Any] = {}
+        self._coords: np.ndarray = np.empty((0, 2))
+        self._city_names: np.ndarray = np.empty(0, dtype=object)
+        self._country_names: np.ndarray = np.empty(0, dtype=object)
         self._load_data()
     
     def _load_data(self):
-        """CSV 데이터 로드"""
+        """CSV 데이터 로드 (인덱스 캐시가 최신이면 캐시 사용)"""
         try:
-            self.cities_df = pd.read_csv(self.csv_path)
-            # NaN 값 제거 및 문자열 타입 확인
-            self.cities_df = self.cities_df.dropna(subset=['city', 'country'])
-            self.cities_df['city'] = self.cities_df['city'].astype(str)
-            self.cities_df['country'] = self.cities_df['country'].astype(str)
+            if not self._load_index_cache():
+                self._build_index()
+                self._save_index_cache()
             
-            # 국가 목록 생성
-            self.countries = set(self.cities_df['country'].str.lower().unique())
+            # numba fallback: 고정 후보 목록은 미리 인코딩
+            if _fuzzy_kernel is not None:
+                self._encoded = {
+                    id(candidates): _fuzzy_kernel.encode_candidates(candidates)
+                    for candidates in (self._cities_lower, self._countries_lower)
+                }
             
-            print(f"✅ [LocationMatcher] Loaded {len(self.cities_df)} cities from {len(self.countries)} countries")
+            logger.info("✅ [LocationMatcher] Loaded %s cities from %s countries", len(self.cities_df), len(self.countries))
         except Exception as e:
-            print(f"❌ [LocationMatcher] Error loading data: {e}")
+            logger.error("❌ [LocationMatcher] Error loading data: %s", e)
             self.cities_df = pd.DataFrame()
             self.countries = set()
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """문자열 유사도 계산 (edit distance 기반)"""
-        return difflib.SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+    def _build_index(self):
+        """CSV를 읽어 검색용 인덱스 생성"""
+        # 사용하는 열만 로드 (city는 문자열, country는 category)
+        self.cities_df = pd.read_csv(
+            self.csv_path,
+            usecols=_CSV_COLUMNS,
+            dtype=_CSV_DTYPES
+        )
+        # NaN 값 제거
+        self.cities_df = self.cities_df.dropna(subset=['city', 'country'])
+        
+        # 국가 목록 생성
+        country_lower = self.cities_df['country'].str.lower()
+        self.countries = set(country_lower.unique())
+        
+        # 유사도 검색용 후보 목록 (쿼리마다 다시 만들지 않도록 미리 계산)
+        self._cities_lower = self.cities_df['city'].str.lower().tolist()
+        self._countries_lower = list(self.countries)
+        
+        # 소문자 이름 -> 행 위치 인덱스 (같은 이름이면 첫 번째 행 유지)
+        self._city_index = {}
+        for i, city in enumerate(self._cities_lower):
+            self._city_index.setdefault(city, i)
+        # 소문자 국가명 -> (CSV 원래 표기, 대표 도시 5개의 행 위치)
+        country_title = {c.lower(): c for c in self.cities_df['country'].cat.categories}
+        self._country_info = {
+            country: (country_title[country], idxs[:5])
+            for country, idxs in country_lower.groupby(country_lower).indices.items()
+        }
+        
+        # 정렬된 고유 도시명 (접두어 범위 검색용)
+        self._city_names_sorted = sorted(self._city_index)
+        
+        # 행 위치로 바로 꺼내 쓰는 열 배열 (lat/lng는 float64 유지)
+        self._coords = self.cities_df[['lat', 'lng']].to_numpy(np.float64)
+        self._city_names = self.cities_df['city'].to_numpy(dtype=object)
+        self._country_names = self.cities_df['country'].to_numpy(dtype=object)
+        
+        # 길이 필터용 도시명 배열과 길이
+        self._cities_arr = np.array(self._cities_lower, dtype=object)
+        self._city_lens = np.fromiter((len(c) for c in self._cities_lower), dtype=np.int16, count=len(self._cities_lower))
+    
+    def _load_index_cache(self) -> bool:
+        """CSV보다 새로운 인덱스 캐시가 있으면 로드"""
+        cache_path = self.csv_path + _INDEX_CACHE_SUFFIX
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(self.csv_path):
+                return False
+            with open(cache_path, "rb") as f:
+                bundle = pickle.load(f)
+            if bundle.get("version") != _INDEX_CACHE_VERSION:
+                return False
+            # 필드가 하나라도 없으면 (오래되거나 손상된 캐시) 인덱스를 새로 생성
+            values = {name: bundle[name] for name in _INDEX_CACHE_FIELDS}
+        except Exception as e:
+            logger.debug("🔍 [LocationMatcher] Ignoring index cache %s: %s", cache_path, e)
+            return False
+        for name, value in values.items():
+            setattr(self, name, value)
+        logger.debug("🔍 [LocationMatcher] Loaded index cache: %s", cache_path)
+        return True
+    
+    def _save_index_cache(self):
+        """인덱스를 pickle로 저장 (실패해도 무시)"""
+        cache_path = self.csv_path + _INDEX_CACHE_SUFFIX
+        bundle = {name: getattr(self, name) for name in _INDEX_CACHE_FIELDS}
+        bundle["version"] = _INDEX_CACHE_VERSION
+        # 임시 파일에 쓴 뒤 교체하므로 동시에 읽는 다른 워커는 완성된 파일만 보게 됨
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug("🔍 [LocationMatcher] Could not write index cache: %s", e)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
     
     def _find_best_match(self, target: str, candidates: List[str], threshold: float = 0.8) -> tuple:
         """가장 유사한 후보 찾기"""
-        best_match = None
-        best_score = 0.0
+        if _fuzzy_kernel is not None:
+            encoded = self._encoded.get(id(candidates)) or _fuzzy_kernel.encode_candidates(candidates)
+            return _fuzzy_kernel.extract_one(target, candidates, encoded, threshold)
         
-        for candidate in candidates:
-            score = self._calculate_similarity(target, candidate)
-            if score > best_score and score >= threshold:
-                best_match = candidate
-                best_score = score
+        # 후보 전체를 C 레벨에서 한 번에 비교 (candidates는 이미 소문자이므로 전처리 생략).
+        # score_cutoff는 더 좋은 후보가 나올 때마다 올라가서 나머지 후보의 계산을 일찍 중단함
+        match = process.extractOne(
+            target, candidates, scorer=fuzz.ratio, processor=None, score_cutoff=threshold * 100
+        )
+        if match is None:
+            return None, 0.0
+        return match[0], match[1] / 100.0
+    
+    def _city_prefix_candidates(self, prefix: str) -> List[str]:
+        """접두어로 시작하는 도시명 목록 (정렬 목록에서 이진 탐색)"""
+        names = self._city_names_sorted
+        start = bisect_left(names, prefix)
+        end = bisect_left(names, prefix + "\uffff", start)
+        return names[start:end]
+    
+    def _city_length_candidates(self, query: str, threshold: float) -> List[str]:
+        """유사도 threshold에 도달할 수 있는 길이의 도시명만 반환
         
-        return best_match, best_score
+        fuzz.ratio는 길이 차이 / 길이 합 만큼은 반드시 깎이므로
+        len(c)는 len(q) * t / (2 - t) 이상, len(q) * (2 - t) / t 이하여야 함
+        """
+        if threshold <= 0:
+            return self._cities_lower
+        query_len = len(query)
+        # 경계값에서의 부동소수점 오차를 고려해 약간 넓게 잡음
+        min_len = query_len * threshold / (2 - threshold) - 1e-9
+        max_len = query_len * (2 - threshold) / threshold + 1e-9
+        mask = (self._city_lens >= min_len) & (self._city_lens <= max_len)
+        return self._cities_arr[mask].tolist()
     
-    def find_city(self, city_name: str, threshold: float = 0.8) -> Dict[str, Any]:
-        """도시명으로 검색하고 매칭 결과 반환"""
+    def _city_row(self, idx: int) -> Dict[str, Any]:
+        """행 위치의 도시/국가/좌표"""
+        lat, lng = self._coords[idx].tolist()
+        return {
+            "city": self._city_names[idx],
+            "country": self._country_names[idx],
+            "coordinates": {"lat": lat, "lng": lng}
+        }
+    
+    def _country_cities(self, idxs: np.ndarray) -> List[Dict[str, Any]]:
+        """국가의 대표 도시 목록"""
+        cities_list = []
+        for idx in idxs:
+            lat, lng = self._coords[idx].tolist()
+            cities_list.append({"city": self._city_names[idx], "lat": lat, "lng": lng})
+        return cities_list
+    
+    def find_city(self, city_name: str, threshold: float = 0.8, city_lower: Optional[str] = None) -> Dict[str, Any]:
+        """도시명으로 검색하고 매칭 결과 반환 (city_lower: 호출 측에서 이미 정규화한 검색어)"""
         if not city_name or self.cities_df.empty:
             return {"found": False, "message": "No city data available"}
         
-        city_lower = city_name.lower().strip()
-        print(f"🔍 [LocationMatcher] Searching for city: '{city_lower}' with threshold: {threshold}")
+        if city_lower is None:
+            city_lower = _norm(city_name)
+        logger.debug("🔍 [LocationMatcher] Searching for city: '%s' with threshold: %s", city_lower, threshold)
         
         # 정확한 매칭 시도
-        exact_matches = self.cities_df[self.cities_df['city'].str.lower() == city_lower]
-        if not exact_matches.empty:
-            row = exact_matches.iloc[0]
-            print(f"✅ [LocationMatcher] Found exact match for city: {city_name.title()}")
+        idx = self._city_index.get(city_lower)
+        if idx is not None:
+            row = self._city_row(idx)
+            logger.debug("✅ [LocationMatcher] Found exact match for city: %s", row['city'])
             return {
                 "found": True,
                 "exact_match": True,
-                "city": row['city'],
-                "country": row['country'],
-                "coordinates": {"lat": row['lat'], "lng": row['lng']}
+                "match_type": "city",
+                **row
             }
         
         # 유사한 도시 검색
-        print(f"🔍 [LocationMatcher] Searching similar cities in {len(self.cities_df)} cities")
-        best_match, best_score = self._find_best_match(city_lower, self.cities_df['city'].str.lower().tolist(), threshold)
+        logger.debug("🔍 [LocationMatcher] Searching similar cities in %s cities", len(self.cities_df))
+        # 같은 접두어를 가진 도시부터 비교하고, 후보가 적거나 못 찾으면 전체 검색
+        best_match, best_score = None, 0.0
+        candidates = self._city_prefix_candidates(city_lower[:3])
+        if len(candidates) >= _PREFIX_MIN_CANDIDATES:
+            best_match, best_score = self._find_best_match(city_lower, candidates, threshold)
+        if not best_match:
+            candidates = self._city_length_candidates(city_lower, threshold)
+            best_match, best_score = self._find_best_match(city_lower, candidates, threshold)
         
-        print(f"🔍 [LocationMatcher] Best match: '{best_match}' with score: {best_score:.3f}")
+        logger.debug("🔍 [LocationMatcher] Best match: '%s' with score: %.3f", best_match, best_score)
         
         if best_match:
-            row = self.cities_df[self.cities_df['city'].str.lower() == best_match].iloc[0]
+            row = self._city_row(self._city_index[best_match])
             return {
                 "found": True,
                 "exact_match": False,
-                "city": row['city'],
-                "country": row['country'],
-                "coordinates": {"lat": row['lat'], "lng": row['lng']},
-                "suggested_city": best_match.title(),
+                "match_type": "city",
+                **row,
+                "suggested_city": row['city'],
                 "suggested_country": row['country'],
                 "similarity_score": best_score,
-                "message": f"혹시 '{best_match.title()}, {row['country']}'을 말씀하신 건가요?"
+                "message": f"혹시 '{row['city']}, {row['country']}'을 말씀하신 건가요?"
             }
         
         return {"found": False, "message": f"'{city_name}'에 해당하는 도시를 찾을 수 없습니다. 다른 도시명을 시도해보세요."}
     
-    def find_country(self, country_name: str, threshold: float = 0.8) -> Dict[str, Any]:
-        """국가명으로 검색하고 매칭 결과 반환"""
+    def find_country(self, country_name: str, threshold: float = 0.8, country_lower: Optional[str] = None) -> Dict[str, Any]:
+        """국가명으로 검색하고 매칭 결과 반환 (country_lower: 호출 측에서 이미 정규화한 검색어)"""
         if not country_name or self.cities_df.empty:
             return {"found": False, "message": "No country data available"}
         
-        country_lower = country_name.lower().strip()
-        print(f"🔍 [LocationMatcher] Searching for country: '{country_lower}' with threshold: {threshold}")
+        if country_lower is None:
+            country_lower = _norm(country_name)
+        logger.debug("🔍 [LocationMatcher] Searching for country: '%s' with threshold: %s", country_lower, threshold)
         
         # 특별 매핑 처리
-        special_mappings = {
-            "south korea": "korea, south",
-            "north korea": "korea, north",
-            "united states": "united states of america",
-            "usa": "united states of america",
-            "uk": "united kingdom",
-            "united kingdom": "united kingdom"
-        }
-        
-        if country_lower in special_mappings:
-            country_lower = special_mappings[country_lower]
-            print(f"🔍 [LocationMatcher] Mapped to: '{country_lower}'")
+        if country_lower in _SPECIAL_COUNTRY_MAPPINGS:
+            country_lower = _SPECIAL_COUNTRY_MAPPINGS[country_lower]
+            logger.debug("🔍 [LocationMatcher] Mapped to: '%s'", country_lower)
         
-        if country_lower in self.countries:
-            country_cities = self.cities_df[self.cities_df['country'].str.lower() == country_lower].head(5)
-            cities_list = [{"city": row['city'], "lat": row['lat'], "lng": row['lng']} for _, row in country_cities.iterrows()]
-            print(f"✅ [LocationMatcher] Found exact match for country: {country_name.title()}")
+        info = self._country_info.get(country_lower)
+        if info is not None:
+            country_title, idxs = info  # CSV 표기 (특별 매핑 후에도 매칭된 국가명 반환)
+            cities_list = self._country_cities(idxs)
+            logger.debug("✅ [LocationMatcher] Found exact match for country: %s", country_title)
             return {
                 "found": True,
                 "exact_match": True,
-                "country": country_name.title(),
+                "match_type": "country",
+                "country": country_title,
                 "cities": cities_list
             }
         else:
             # 유사한 국가 검색 (edit distance 기반)
-            print(f"🔍 [LocationMatcher] Searching similar countries in {len(self.countries)} countries")
-            best_match, best_score = self._find_best_match(country_lower, list(self.countries), threshold)
+            logger.debug("🔍 [LocationMatcher] Searching similar countries in %s countries", len(self.countries))
+            best_match, best_score = self._find_best_match(country_lower, self._countries_lower, threshold)
             
-            print(f"🔍 [LocationMatcher] Best match: '{best_match}' with score: {best_score:.3f}")
+            logger.debug("🔍 [LocationMatcher] Best match: '%s' with score: %.3f", best_match, best_score)
             
             if best_match:
-                country_cities = self.cities_df[self.cities_df['country'].str.lower() == best_match].head(5)
-                cities_list = [{"city": row['city'], "lat": row['lat'], "lng": row['lng']} for _, row in country_cities.iterrows()]
+                country_title, idxs = self._country_info[best_match]
+                cities_list = self._country_cities(idxs)
                 return {
                     "found": True,
                     "exact_match": False,
-                    "country": best_match.title(),
+                    "match_type": "country",
+                    "country": country_title,
                     "cities": cities_list,
-                    "suggested_country": best_match.title(),
+                    "suggested_country": country_title,
                     "similarity_score": best_score,
-                    "message": f"혹시 '{best_match.title()}'을 말씀하신 건가요?"
+                    "message": f"혹시 '{country_title}'을 말씀하신 건가요?"
                 }
         
         return {"found": False, "message": f"'{country_name}'에 해당하는 국가를 찾을 수 없습니다. 다른 국가명을 시도해보세요."}
@@ -160,85 +353,89 @@ class LocationMatcher:
             return {"found": False, "message": "No location data available"}
         
         message = message.strip()
-        print(f"🔍 [LocationMatcher] extract_location_from_message called with: '{message}' (search_type: {search_type})")
+        message_lower = message.lower()
+        logger.debug("🔍 [LocationMatcher] extract_location_from_message called with: '%s' (search_type: %s)", message, search_type)
         
         # 부정적 응답 처리 ("No," 제거)
-        negative_words = ["no,", "아니", "아니요", "아니다"]
-        for word in negative_words:
-            if message.lower().startswith(word):
+        for word in _NEGATIVE_PREFIXES:
+            if message_lower.startswith(word):
                 message = message[len(word):].strip()
-                print(f"🔍 [LocationMatcher] After negative word processing: '{message}'")
+                message_lower = message.lower()
+                logger.debug("🔍 [LocationMatcher] After negative word processing: '%s'", message)
                 break
         
-        # 위치 정보가 아닌 일반적인 단어들은 무시
-        non_location_words = {
-            '해수면', '상승', '분석', '위험', '도시', '지역', '인프라', '노출', 
-            '토픽', '모델링', 'year', '년', '미터', 'meter', 'm', 'threshold',
-            'yes', 'no', '응', '아니', '맞아', '맞다', 'ok', 'okay'
-        }
-        
-        if message.lower() in non_location_words:
-            print(f"🔍 [LocationMatcher] Ignoring non-location word: '{message.lower()}'")
+        # 위치 정보가 아닌 일반적인 단어들은 무시 (intern해서 포인터 비교로 끝나도록)
+        message_lower = sys.intern(message_lower)
+        if message_lower in _NON_LOCATION_WORDS:
+            logger.debug("🔍 [LocationMatcher] Ignoring non-location word: '%s'", message_lower)
             return {"found": False, "message": "위치 정보가 아닙니다."}
         
         # 쉼표로 구분된 경우 (예: "Seoul, South Korea")
-        if ',' in message:
-            parts = [part.strip() for part in message.split(',')]
-            print(f"🔍 [LocationMatcher] Comma-separated parts: {parts}")
+        head, sep, tail = message.partition(',')
+        if sep:
+            # 쉼표 하나면 partition 결과를 그대로, 여러 개면 정규식으로 분리
+            if ',' in tail:
+                parts = _COMMA_SPLIT_RE.split(message)
+            else:
+                parts = [head.strip(), tail.strip()]
+            logger.debug("🔍 [LocationMatcher] Comma-separated parts: %s", parts)
+            
+            # 너무 짧은 단어와 일반 단어는 제외 (소문자 변환은 한 번만 하고 검색에도 재사용)
+            candidate_parts = [
+                (part, part_lower)
+                for part, part_lower in ((part, part.lower()) for part in parts)
+                if part_lower not in _NON_LOCATION_WORDS and len(part) > 2
+            ]
             
             # search_type에 따라 검색 우선순위 결정
             if search_type == "city":
                 # 도시 우선 검색
-                for part in parts:
-                    if part.lower() not in non_location_words and len(part) > 2:
-                        print(f"🔍 [LocationMatcher] Trying city search for part: '{part}'")
-                        city_result = self.find_city(part)
-                        if city_result["found"]:
-                            return city_result
+                for part, part_lower in candidate_parts:
+                    logger.debug("🔍 [LocationMatcher] Trying city search for part: '%s'", part)
+                    city_result = self.find_city(part, city_lower=part_lower)
+                    if city_result["found"]:
+                        return city_result
             elif search_type == "country":
                 # 국가 우선 검색
-                for part in parts:
-                    if part.lower() not in non_location_words and len(part) > 2:
-                        print(f"🔍 [LocationMatcher] Trying country search for part: '{part}'")
-                        country_result = self.find_country(part)
-                        if country_result["found"]:
-                            return country_result
+                for part, part_lower in candidate_parts:
+                    logger.debug("🔍 [LocationMatcher] Trying country search for part: '%s'", part)
+                    country_result = self.find_country(part, country_lower=part_lower)
+                    if country_result["found"]:
+                        return country_result
             else:
                 # auto: 도시 먼저, 그 다음 국가
-                for part in parts:
-                    if part.lower() not in non_location_words and len(part) > 2:
-                        print(f"🔍 [LocationMatcher] Trying city search for part: '{part}'")
-                        city_result = self.find_city(part)
-                        if city_result["found"]:
-                            return city_result
+                for part, part_lower in candidate_parts:
+                    logger.debug("🔍 [LocationMatcher] Trying city search for part: '%s'", part)
+                    city_result = self.find_city(part, city_lower=part_lower)
+                    if city_result["found"]:
+                        return city_result
                 
-                for part in parts:
-                    if part.lower() not in non_location_words and len(part) > 2:
-                        print(f"🔍 [LocationMatcher] Trying country search for part: '{part}'")
-                        country_result = self.find_country(part)
-                        if country_result["found"]:
-                            return country_result
+                for part, part_lower in candidate_parts:
+                    logger.debug("🔍 [LocationMatcher] Trying country search for part: '%s'", part)
+                    country_result = self.find_country(part, country_lower=part_lower)
+                    if country_result["found"]:
+                        return country_result
         else:
             # 단일 텍스트 처리
-            print(f"🔍 [LocationMatcher] Single text processing for: '{message}'")
+            logger.debug("🔍 [LocationMatcher] Single text processing for: '%s'", message)
             
             if search_type == "city":
                 # 도시만 검색
-                return self.find_city(message)
+                return self.find_city(message, city_lower=message_lower)
             elif search_type == "country":
                 # 국가만 검색
-                return self.find_country(message)
+                return self.find_country(message, country_lower=message_lower)
             else:
                 # auto: 도시 먼저, 그 다음 국가
-                city_result = self.find_city(message)
+                city_result = self.find_city(message, city_lower=message_lower)
                 if city_result["found"]:
                     return city_result
                 
-                country_result = self.find_country(message)
+                country_result = self.find_country(message, country_lower=message_lower)
                 if country_result["found"]:
                     return country_result
         
         return {"found": False, "message": "위치 정보를 찾을 수 없습니다."}
 
-# 전역 인스턴스 생성
+# 전역 인스턴스 (프로세스당 한 번만 로드, 다른 matcher 모듈도 이 인스턴스를 재사용)
 location_matcher = LocationMatcher()
@@ -2,10 +2,46 @@
 ADK Location Matcher Utility
 """
 
+import logging
 import pandas as pd
+import numpy as np
 import os
-from typing import Dict, List, Tuple, Optional
-import difflib
+from typing import Any, Dict, List, Tuple, Optional
+from rapidfuzz import fuzz, process
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# 부정어 (뒤에 쉼표가 오는 경우만 처리)
+_NEGATIVE_WORDS = ('no', '아니', 'not', '아니다')
+
+# 위치 정보가 아닌 일반적인 단어들
+_NON_LOCATION_WORDS = frozenset(sys.intern(word) for word in (
+    '해수면', '상승', '분석', '위험', '도시', '지역', '인프라', '노출', 
+    '토픽', '모델링', 'year', '년', '미터', 'meter', 'm', 'threshold',
+    'yes', 'no', '응', '아니', '맞아', '맞다', 'ok', 'okay'
+))
+
+# 쉼표 구분 (주변 공백 포함)
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# 국가명 특별 매핑
+_SPECIAL_COUNTRY_MAPPINGS = MappingProxyType({
+    "south korea": "korea, south",
+    "north korea": "korea, north",
+    "united states": "united states of america",
+    "usa": "united states of america",
+    "uk": "united kingdom",
+    "united kingdom": "united kingdom"
+})
+
+# "in Seoul, South Korea" 패턴
+_LOCATION_RE = re.compile(r'in\s+([^,]+)(?:,\s*([^,\s]+))?')
+# "South Korea for 2020" -> "South Korea"
+_COUNTRY_TAIL_RE = re.compile(r'\s+(for|with|in|at|on|by)\s+.*')
 
 class LocationMatcher:
     """위치 매칭을 위한 유틸리티 클래스"""
@@ -16,6 +52,10 @@ class LocationMatcher:
         self.countries = set()
         self.cities = set()
         self.city_country_mapping = {}
+        self._cities_lower: List[str] = []
+        self._countries_lower: List[str] = []
+        self._city_index: Dict[str, int] = {}
+        self._country_groups: Dict[str, np.ndarray] = {}
         self._load_data()
 
     def _load_data(self):
@@ -24,52 +64,62 @@ class LocationMatcher:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             csv_file_path = os.path.join(current_dir, "..", "..", "..", "..", self.csv_path)
             
-            self.cities_df = pd.read_csv(csv_file_path)
+            # 사용하는 열만 로드 (lat/lng는 JSON 직렬화를 위해 float64 유지)
+            self.cities_df = pd.read_csv(
+                csv_file_path,
+                usecols=['city', 'city_ascii', 'country', 'lat', 'lng'],
+                dtype={'city': 'string', 'city_ascii': 'string', 'country': 'category'}
+            )
             
             # NaN 값 제거 및 문자열 타입 확인
             self.cities_df = self.cities_df.dropna(subset=['city', 'country'])
             
+            # 소문자 열을 한 번에 계산 (문자열이 아닌 값은 NaN)
+            city_lower = self.cities_df['city'].str.lower()
+            ascii_lower = self.cities_df['city_ascii'].str.lower()
+            country_lower = self.cities_df['country'].str.lower()
+            countries = self.cities_df['country'].values
+            
             # 국가 목록 생성
-            self.countries = set()
-            for country in self.cities_df['country'].unique():
-                if pd.notna(country) and isinstance(country, str):
-                    self.countries.add(country.lower())
+            self.countries = set(country_lower.dropna().unique())
             
             # 도시 목록 및 매핑 생성
-            self.cities = set()
-            for _, row in self.cities_df.iterrows():
-                if pd.notna(row['city']) and isinstance(row['city'], str):
-                    self.cities.add(row['city'].lower())
-                    self.city_country_mapping[row['city'].lower()] = row['country']
-                
-                if pd.notna(row['city_ascii']) and isinstance(row['city_ascii'], str):
-                    self.cities.add(row['city_ascii'].lower())
-                    self.city_country_mapping[row['city_ascii'].lower()] = row['country']
+            has_city = city_lower.notna().values
+            has_ascii = ascii_lower.notna().values
+            self.city_country_mapping = dict(zip(city_lower.values[has_city], countries[has_city]))
+            self.city_country_mapping.update(zip(ascii_lower.values[has_ascii], countries[has_ascii]))
+            self.cities = set(self.city_country_mapping)
+            
+            # 유사도 검색용 후보 목록 (쿼리마다 다시 만들지 않도록 미리 계산)
+            self._cities_lower = list(self.cities)
+            self._countries_lower = list(self.countries)
             
-            print(f"✅ [LocationMatcher] Loaded {len(self.cities_df)} cities from {len(self.countries)} countries")
+            # 소문자 city / city_ascii -> 첫 번째로 일치하는 행 위치
+            self._city_index = {}
+            for i, (city, city_ascii) in enumerate(zip(city_lower.values, ascii_lower.values)):
+                if isinstance(city, str):
+                    self._city_index.setdefault(city, i)
+                if isinstance(city_ascii, str):
+                    self._city_index.setdefault(city_ascii, i)
+            # 소문자 국가명 -> 행 위치 배열
+            self._country_groups = country_lower.groupby(country_lower).indices
+            
+            logger.info("✅ [LocationMatcher] Loaded %s cities from %s countries", len(self.cities_df), len(self.countries))
             
         except Exception as e:
-            print(f"❌ [LocationMatcher] Error loading worldcities.csv: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ [LocationMatcher] Error loading worldcities.csv: %s", e)
             self.cities_df = pd.DataFrame()
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """두 문자열의 유사도를 계산 (0.0 ~ 1.0)"""
-        return difflib.SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
-    
     def _find_best_match(self, query: str, candidates: List[str], threshold: float = 0.8) -> Tuple[str, float]:
         """후보들 중에서 가장 유사한 문자열을 찾아 반환"""
-        best_match = None
-        best_score = 0.0
-        
-        for candidate in candidates:
-            score = self._calculate_similarity(query, candidate)
-            if score > best_score and score >= threshold:
-                best_match = candidate
-                best_score = score
-        
-        return best_match, best_score
+        # 후보 전체를 C 레벨에서 한 번에 비교 (candidates는 이미 소문자이므로 전처리 생략).
+        # score_cutoff는 더 좋은 후보가 나올 때마다 올라가서 나머지 후보의 계산을 일찍 중단함
+        match = process.extractOne(
+            query, candidates, scorer=fuzz.ratio, processor=None, score_cutoff=threshold * 100
+        )
+        if match is None:
+            return None, 0.0
+        return match[0], match[1] / 100.0
 
     def find_city(self, city_name: str, threshold: float = 0.8) -> Dict[str, any]:
         """도시명으로 검색하고 매칭 결과 반환"""
@@ -79,7 +129,7 @@ class LocationMatcher:
         city_lower = city_name.lower().strip()
         
         if city_lower in self.cities:
-            row = self.cities_df[(self.cities_df['city'].str.lower() == city_lower) | (self.cities_df['city_ascii'].str.lower() == city_lower)].iloc[0]
+            row = self.cities_df.iloc[self._city_index[city_lower]]
             return {
                 "found": True,
                 "exact_match": True,
@@ -89,9 +139,9 @@ class LocationMatcher:
             }
         else:
             # 유사한 도시 검색 (edit distance 기반)
-            best_match, best_score = self._find_best_match(city_lower, list(self.cities), threshold)
+            best_match, best_score = self._find_best_match(city_lower, self._cities_lower, threshold)
             if best_match:
-                row = self.cities_df[(self.cities_df['city'].str.lower() == best_match) | (self.cities_df['city_ascii'].str.lower() == best_match)].iloc[0]
+                row = self.cities_df.iloc[self._city_index[best_match]]
                 return {
                     "found": True,
                     "exact_match": False,
@@ -112,26 +162,17 @@ class LocationMatcher:
             return {"found": False, "message": "No country data available"}
         
         country_lower = country_name.lower().strip()
-        print(f"🔍 [LocationMatcher] Searching for country: '{country_lower}' with threshold: {threshold}")
+        logger.debug("🔍 [LocationMatcher] Searching for country: '%s' with threshold: %s", country_lower, threshold)
         
         # 특별 매핑 처리
-        special_mappings = {
-            "south korea": "korea, south",
-            "north korea": "korea, north",
-            "united states": "united states of america",
-            "usa": "united states of america",
-            "uk": "united kingdom",
-            "united kingdom": "united kingdom"
-        }
-        
-        if country_lower in special_mappings:
-            country_lower = special_mappings[country_lower]
-            print(f"🔍 [LocationMatcher] Mapped to: '{country_lower}'")
+        if country_lower in _SPECIAL_COUNTRY_MAPPINGS:
+            country_lower = _SPECIAL_COUNTRY_MAPPINGS[country_lower]
+            logger.debug("🔍 [LocationMatcher] Mapped to: '%s'", country_lower)
         
         if country_lower in self.countries:
-            country_cities = self.cities_df[self.cities_df['country'].str.lower() == country_lower].head(5)
+            country_cities = self.cities_df.iloc[self._country_groups[country_lower][:5]]
             cities_list = [{"city": row['city'], "lat": row['lat'], "lng": row['lng']} for _, row in country_cities.iterrows()]
-            print(f"✅ [LocationMatcher] Found exact match for country: {country_name.title()}")
+            logger.debug("✅ [LocationMatcher] Found exact match for country: %s", country_name.title())
             return {
                 "found": True,
                 "exact_match": True,
@@ -140,13 +181,13 @@ class LocationMatcher:
             }
         else:
             # 유사한 국가 검색 (edit distance 기반)
-            print(f"🔍 [LocationMatcher] Searching similar countries in {len(self.countries)} countries")
-            best_match, best_score = self._find_best_match(country_lower, list(self.countries), threshold)
+            logger.debug("🔍 [LocationMatcher] Searching similar countries in %s countries", len(self.countries))
+            best_match, best_score = self._find_best_match(country_lower, self._countries_lower, threshold)
             
-            print(f"🔍 [LocationMatcher] Best match: '{best_match}' with score: {best_score:.3f}")
+            logger.debug("🔍 [LocationMatcher] Best match: '%s' with score: %.3f", best_match, best_score)
             
             if best_match:
-                country_cities = self.cities_df[self.cities_df['country'].str.lower() == best_match].head(5)
+                country_cities = self.cities_df.iloc[self._country_groups[best_match][:5]]
                 cities_list = [{"city": row['city'], "lat": row['lat'], "lng": row['lng']} for _, row in country_cities.iterrows()]
                 return {
                     "found": True,
@@ -162,47 +203,37 @@ class LocationMatcher:
 
     def extract_location_from_message(self, message: str, search_type: str = "auto") -> Dict[str, Any]:
         """메시지에서 위치 정보 추출"""
-        print(f"🔍 [LocationMatcher] extract_location_from_message called with: '{message}'")
+        logger.debug("🔍 [LocationMatcher] extract_location_from_message called with: '%s'", message)
         message_lower = message.lower().strip()
         
         # 부정어가 포함된 경우 처리 (예: "No, Busan" -> "Busan"만 추출)
-        negative_words = ['no', '아니', 'not', '아니다']
-        for neg_word in negative_words:
+        for neg_word in _NEGATIVE_WORDS:
             if message_lower.startswith(neg_word + ','):
                 message = message.split(',', 1)[1].strip()
                 message_lower = message.lower()
-                print(f"🔍 [LocationMatcher] After negative word processing: '{message_lower}'")
+                logger.debug("🔍 [LocationMatcher] After negative word processing: '%s'", message_lower)
                 break
         
-        # 위치 정보가 아닌 일반적인 단어들은 무시
-        non_location_words = {
-            '해수면', '상승', '분석', '위험', '도시', '지역', '인프라', '노출', 
-            '토픽', '모델링', 'year', '년', '미터', 'meter', 'm', 'threshold',
-            'yes', 'no', '응', '아니', '맞아', '맞다', 'ok', 'okay'
-        }
-        
-        if message_lower in non_location_words:
-            print(f"🔍 [LocationMatcher] Ignoring non-location word: '{message_lower}'")
+        # 위치 정보가 아닌 일반적인 단어들은 무시 (intern해서 포인터 비교로 끝나도록)
+        message_lower = sys.intern(message_lower)
+        if message_lower in _NON_LOCATION_WORDS:
+            logger.debug("🔍 [LocationMatcher] Ignoring non-location word: '%s'", message_lower)
             return {
                 "type": "none",
                 "result": {"found": False, "message": "위치 정보가 아닙니다."},
                 "original_text": message
             }
         
-        # 정규식을 사용하여 위치 정보 추출
-        import re
-        
-        # "in Seoul, South Korea" 패턴 추출
-        location_pattern = r'in\s+([^,]+)(?:,\s*([^,\s]+))?'
-        match = re.search(location_pattern, message_lower)
+        # 정규식을 사용하여 위치 정보 추출 ("in Seoul, South Korea" 패턴)
+        match = _LOCATION_RE.search(message_lower)
         if match:
             city_part = match.group(1).strip()
             country_part = match.group(2).strip() if match.group(2) else None
             
-            print(f"🔍 [LocationMatcher] Extracted from pattern - City: '{city_part}', Country: '{country_part}'")
+            logger.debug("🔍 [LocationMatcher] Extracted from pattern - City: '%s', Country: '%s'", city_part, country_part)
             
             # 도시 검색
-            if city_part and city_part not in non_location_words:
+            if city_part and city_part not in _NON_LOCATION_WORDS:
                 city_result = self.find_city(city_part)
                 if city_result["found"] and city_result["exact_match"]:
                     return {
@@ -212,9 +243,9 @@ class LocationMatcher:
                     }
             
             # 국가 검색 (더 정확한 패턴으로)
-            if country_part and country_part not in non_location_words:
+            if country_part and country_part not in _NON_LOCATION_WORDS:
                 # "South Korea for 2020" -> "South Korea"만 추출
-                country_clean = re.sub(r'\s+(for|with|in|at|on|by)\s+.*', '', country_part).strip()
+                country_clean = _COUNTRY_TAIL_RE.sub('', country_part).strip()
                 if country_clean:
                     country_result = self.find_country(country_clean)
                     if country_result["found"] and country_result["exact_match"]:
@@ -225,55 +256,72 @@ class LocationMatcher:
                         }
         
         # 쉼표로 구분된 경우 처리 (예: "Korea, Busan")
-        if ',' in message:
-            parts = [part.strip() for part in message.split(',')]
-            print(f"🔍 [LocationMatcher] Comma-separated parts: {parts}")
+        head, sep, tail = message.strip().partition(',')
+        if sep:
+            # 쉼표 하나면 partition 결과를 그대로, 여러 개면 정규식으로 분리
+            if ',' in tail:
+                parts = _COMMA_SPLIT_RE.split(message.strip())
+            else:
+                parts = [head.strip(), tail.strip()]
+            logger.debug("🔍 [LocationMatcher] Comma-separated parts: %s", parts)
+            
+            # 너무 짧은 단어와 일반 단어는 제외
+            candidate_parts = [
+                part for part in parts
+                if part.lower() not in _NON_LOCATION_WORDS and len(part) > 2
+            ]
             
             # 먼저 도시 검색 (더 구체적이므로 우선순위)
-            for part in parts:
-                if part.lower() not in non_location_words and len(part) > 2:  # 너무 짧은 단어는 제외
-                    print(f"🔍 [LocationMatcher] Trying city search for part: '{part}'")
-                    city_result = self.find_city(part)
-                    if city_result["found"] and city_result["exact_match"]:
-                        return {
-                            "type": "city",
-                            "result": city_result,
-                            "original_text": part
-                        }
+            city_results = []
+            for part in candidate_parts:
+                logger.debug("🔍 [LocationMatcher] Trying city search for part: '%s'", part)
+                city_result = self.find_city(part)
+                if city_result["found"] and city_result["exact_match"]:
+                    return {
+                        "type": "city",
+                        "result": city_result,
+                        "original_text": part
+                    }
+                city_results.append((part, city_result))
             
             # 도시가 정확히 매칭되지 않으면 국가 검색
-            for part in parts:
-                if part.lower() not in non_location_words and len(part) > 2:  # 너무 짧은 단어는 제외
-                    print(f"🔍 [LocationMatcher] Trying country search for part: '{part}'")
-                    country_result = self.find_country(part)
-                    if country_result["found"] and country_result["exact_match"]:
-                        return {
-                            "type": "country", 
-                            "result": country_result,
-                            "original_text": part
-                        }
+            for part in candidate_parts:
+                logger.debug("🔍 [LocationMatcher] Trying country search for part: '%s'", part)
+                country_result = self.find_country(part)
+                if country_result["found"] and country_result["exact_match"]:
+                    return {
+                        "type": "country", 
+                        "result": country_result,
+                        "original_text": part
+                    }
             
-            # 정확한 매칭이 없으면 유사한 도시 제안
-            for part in parts:
-                if part.lower() not in non_location_words and len(part) > 2:  # 너무 짧은 단어는 제외
-                    city_result = self.find_city(part)
-                    if city_result["found"] and not city_result["exact_match"]:
-                        return {
-                            "type": "city",
-                            "result": city_result,
-                            "original_text": part
-                        }
+            # 정확한 매칭이 없으면 유사한 도시 제안 (위에서 구한 결과 재사용)
+            for part, city_result in city_results:
+                if city_result["found"]:
+                    return {
+                        "type": "city",
+                        "result": city_result,
+                        "original_text": part
+                    }
         
         # 단일 텍스트 처리 - 도시와 국가를 모두 시도하되, 더 유사한 것을 선택
-        print(f"🔍 [LocationMatcher] Single text processing for: '{message}'")
+        logger.debug("🔍 [LocationMatcher] Single text processing for: '%s'", message)
         
         # 도시 검색
         city_result = self.find_city(message)
-        print(f"🔍 [LocationMatcher] City result: {city_result}")
+        logger.debug("🔍 [LocationMatcher] City result: %s", city_result)
+        
+        # 도시가 정확히 일치하면 국가 결과와 상관없이 도시가 선택되므로 바로 반환
+        if city_result["found"] and city_result["exact_match"]:
+            return {
+                "type": "city",
+                "result": city_result,
+                "original_text": message
+            }
         
         # 국가 검색  
         country_result = self.find_country(message)
-        print(f"🔍 [LocationMatcher] Country result: {country_result}")
+        logger.debug("🔍 [LocationMatcher] Country result: %s", country_result)
         
         # 둘 다 찾았으면 더 정확한 것을 선택
         if city_result["found"] and country_result["found"]:
@@ -326,5 +374,7 @@ class LocationMatcher:
             "original_text": message
         }
 
-# 전역 인스턴스 생성
-location_matcher = LocationMatcher()
+@lru_cache(maxsize=1)
+def get_location_matcher() -> LocationMatcher:
+    """처음 호출될 때만 CSV를 로드하는 인스턴스 반환 (import 시에는 로드하지 않음)"""
+    return LocationMatcher()
@@ -2,215 +2,244 @@
 ADK Parameter Collection Utility
 """
 
+import logging
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from .location_matcher import location_matcher
 
+logger = logging.getLogger(__name__)
+
+# 단답형 응답 패턴 (예: "2020", "2020년", "1.5m", "2 미터")
+_BARE_YEAR_RE = re.compile(r'((?:19|20)\d{2})\s*(?:년|year)?', re.IGNORECASE)
+_BARE_THRESHOLD_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:m|meters?|미터)', re.IGNORECASE)
+
+# 연도 추출 패턴 ("year: 2020", "in 2020", "2020년", "2020")
+_YEAR_RE = re.compile(r'year\s*:?\s*(?P<y1>\d{4})|in\s+(?P<y2>\d{4})|(?P<y3>\d{4})', re.IGNORECASE)
+
+# 연도 범위 패턴 (예: "2014-2020", "2014 to 2020", "2014부터 2020까지", "from 2014 to 2020")
+_YEAR_RANGE_RE = re.compile(r'(?P<start>\d{4})\s*(?:[-~]|to|부터)\s*(?P<end>\d{4})', re.IGNORECASE)
+
+# 임계값 추출 패턴 ("threshold: 2", "2m", "2 meters", "2 미터")
+_THRESHOLD_RE = re.compile(
+    r'threshold\s*:?\s*(?P<t1>\d+(?:\.\d+)?)|(?P<t2>\d+(?:\.\d+)?)\s*(?:meters?|m|미터)',
+    re.IGNORECASE
+)
+
+# 토픽 모델링 방법 / 토픽 개수 패턴
+# "method: lda" 형태도 단어 경계만으로 잡히므로 접두어 분기 없이 하나의 그룹으로 처리
+_METHOD_RE = re.compile(r'\b(lda|nmf|bertopic)\b', re.IGNORECASE)
+_N_TOPICS_RE = re.compile(r'(?P<n1>\d+)\s*topics?|n_topics\s*:?\s*(?P<n2>\d+)', re.IGNORECASE)
+
+# 위치가 확정되면 지워야 하는 이전 턴의 제안/오류 항목
+_LOCATION_FEEDBACK_KEYS = ('location_error', 'suggestion_message', 'suggested_city', 'suggested_country')
+
+# 각 task별로 필요한 파라미터와 수집 순서 정의
+_REQUIRED_PARAMS = {
+    "sea_level_rise": ("country_name", "city_name", "year", "threshold"),
+    "urban_analysis": ("country_name", "city_name", "start_year", "end_year", "threshold"),
+    "infrastructure_analysis": ("country_name", "city_name", "year", "threshold"),
+    "topic_modeling": ("method", "n_topics")
+}
+
+# 누락 여부를 빠르게 확인하기 위한 집합
+_REQUIRED_SETS = {task: frozenset(params) for task, params in _REQUIRED_PARAMS.items()}
+
+# 각 task별 파라미터 질문 템플릿
+_PARAMETER_QUESTIONS = {
+    "sea_level_rise": {
+        "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
+        "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
+        "year": "어떤 연도로 분석하시겠습니까? (예: 2020, 2018)",
+        "threshold": "해수면 상승 임계값을 설정해주세요 (예: 2.0m, 1.5m)"
+    },
+    "urban_analysis": {
+        "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
+        "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
+        "start_year": "시작 연도를 입력해주세요 (예: 2014, 2015)",
+        "end_year": "종료 연도를 입력해주세요 (예: 2020, 2019)",
+        "threshold": "해수면 상승 임계값을 설정해주세요 (예: 2.0m, 1.5m)"
+    },
+    "infrastructure_analysis": {
+        "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
+        "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
+        "year": "어떤 연도로 분석하시겠습니까? (예: 2020, 2018)",
+        "threshold": "해수면 상승 임계값을 설정해주세요 (예: 2.0m, 1.5m)"
+    },
+    "topic_modeling": {
+        "method": "어떤 방법을 사용하시겠습니까? (lda, bertopic)",
+        "n_topics": "토픽 수를 설정해주세요 (예: 10, 15)"
+    }
+}
+
+# task별 템플릿에 없는 매개변수용 기본 질문
+_DEFAULT_QUESTIONS = {
+    "year": "어떤 연도로 분석하시겠습니까? (예: 2020, 2018)",
+    "start_year": "시작 연도를 입력해주세요 (예: 2014, 2015)",
+    "end_year": "종료 연도를 입력해주세요 (예: 2020, 2019)",
+    "threshold": "해수면 상승 임계값을 설정해주세요. (예: 1.0m, 2.5m)",
+    "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
+    "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
+    "method": "토픽 모델링 방법을 선택해주세요. (lda, nmf, bertopic)",
+    "n_topics": "몇 개의 토픽으로 분석하시겠습니까? (예: 5, 10)"
+}
+
+# 숫자형 매개변수의 허용 범위 (양 끝 포함) - 추출과 검증이 함께 사용
+_VALID_YEARS = (2000, 2024)
+_NUMERIC_BOUNDS = {
+    "year": _VALID_YEARS,
+    "start_year": _VALID_YEARS,
+    "end_year": _VALID_YEARS,
+    "threshold": (0.5, 5.0),
+    "n_topics": (2, 20)
+}
+
+@lru_cache(maxsize=128)
+def _match_location(message: str) -> Dict[str, Any]:
+    """메시지의 위치 검색 결과 (같은 메시지를 다시 보내면 캐시된 결과 재사용, 읽기 전용)"""
+    return location_matcher.extract_location_from_message(message, "auto")
+
 class ParameterCollector:
     """분석에 필요한 매개변수를 수집하는 유틸리티 클래스"""
     
     def __init__(self):
-        # 각 task별로 필요한 파라미터와 수집 순서 정의
-        self.required_params = {
-            "sea_level_rise": ["country_name", "city_name", "year", "threshold"],
-            "urban_analysis": ["country_name", "city_name", "start_year", "end_year", "threshold"],
-            "infrastructure_analysis": ["country_name", "city_name", "year", "threshold"],
-            "topic_modeling": ["method", "n_topics"]
-        }
-        
-        # 각 task별 파라미터 질문 템플릿
-        self.parameter_questions = {
-            "sea_level_rise": {
-                "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
-                "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
-                "year": "어떤 연도로 분석하시겠습니까? (예: 2020, 2018)",
-                "threshold": "해수면 상승 임계값을 설정해주세요 (예: 2.0m, 1.5m)"
-            },
-            "urban_analysis": {
-                "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
-                "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
-                "start_year": "시작 연도를 입력해주세요 (예: 2014, 2015)",
-                "end_year": "종료 연도를 입력해주세요 (예: 2020, 2019)",
-                "threshold": "해수면 상승 임계값을 설정해주세요 (예: 2.0m, 1.5m)"
-            },
-            "infrastructure_analysis": {
-                "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
-                "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
-                "year": "어떤 연도로 분석하시겠습니까? (예: 2020, 2018)",
-                "threshold": "해수면 상승 임계값을 설정해주세요 (예: 2.0m, 1.5m)"
-            },
-            "topic_modeling": {
-                "method": "어떤 방법을 사용하시겠습니까? (lda, bertopic)",
-                "n_topics": "토픽 수를 설정해주세요 (예: 10, 15)"
-            }
-        }
-        
-        self.valid_years = list(range(2000, 2025))
-        self.valid_thresholds = (0.5, 5.0)
+        # 설정 테이블은 모듈 상수를 공유 (인스턴스마다 새로 만들지 않음)
+        self.required_params = _REQUIRED_PARAMS
+        self._required_sets = _REQUIRED_SETS
+        self.parameter_questions = _PARAMETER_QUESTIONS
+        self.numeric_bounds = _NUMERIC_BOUNDS
     
-    async def _extract_parameters(self, message: str, analysis_type: str, existing_params: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _in_bounds(self, param: str, value: Any) -> bool:
+        """숫자형 매개변수 값이 허용 범위(numeric_bounds) 안인지 확인"""
+        low, high = self.numeric_bounds[param]
+        return isinstance(value, (int, float)) and low <= value <= high
+    
+    def _extract_parameters(self, message: str, analysis_type: str, existing_params: Dict[str, Any] = None) -> Dict[str, Any]:
         """사용자 메시지에서 매개변수 추출"""
+        if existing_params is None:
+            existing_params = {}
+        
         extracted = {}
-        message_lower = message.lower()
         
-        # 연도 추출
-        year_patterns = [
-            r'(\d{4})',
-            r'year\s*:?\s*(\d{4})',
-            r'in\s+(\d{4})',
-            r'(\d{4})\s*year',
-            r'(\d{4})\s*년'  # 한국어 "년" 패턴 추가
-        ]
+        # 이미 수집된 매개변수는 다시 추출하지 않음
+        collected = {key for key, value in existing_params.items() if value is not None}
+        needed = set(self.required_params.get(analysis_type, [])) - collected
+        
+        # 숫자가 없는 메시지(대부분의 대화형 응답)는 연도/임계값/토픽 수 정규식을 건너뜀
+        if not any(map(str.isdigit, message)):
+            needed.difference_update(self.numeric_bounds)
         
-        # 각 분석 유형별로 연도 추출
+        # 연도 추출 (각 분석 유형별로)
         if analysis_type == "urban_analysis":
-            # urban_analysis는 start_year와 end_year를 개별적으로 수집
-            # 연도 범위 패턴 (예: "2014-2020", "2014 to 2020", "2014부터 2020까지")
-            range_patterns = [
-                r'(\d{4})\s*[-~]\s*(\d{4})',
-                r'(\d{4})\s+to\s+(\d{4})',
-                r'(\d{4})\s+부터\s+(\d{4})\s+까지',
-                r'from\s+(\d{4})\s+to\s+(\d{4})',
-                r'(\d{4})\s*-\s*(\d{4})'
-            ]
-            
-            for pattern in range_patterns:
-                match = re.search(pattern, message_lower)
-                if match:
-                    start_year = int(match.group(1))
-                    end_year = int(match.group(2))
-                    if (start_year in self.valid_years and end_year in self.valid_years and 
+            if needed & {"start_year", "end_year"}:
+                # urban_analysis는 start_year와 end_year를 개별적으로 수집
+                # 연도 범위 패턴 (예: "2014-2020", "2014 to 2020", "2014부터 2020까지")
+                for match in _YEAR_RANGE_RE.finditer(message):
+                    start_year = int(match.group('start'))
+                    end_year = int(match.group('end'))
+                    if (self._in_bounds("start_year", start_year) and self._in_bounds("end_year", end_year) and 
                         start_year <= end_year):
                         extracted['start_year'] = start_year
                         extracted['end_year'] = end_year
-                        print(f"🔍 [ParameterCollector] Urban analysis range: start_year={start_year}, end_year={end_year}")
+                        logger.debug("🔍 [ParameterCollector] Urban analysis range: start_year=%s, end_year=%s", start_year, end_year)
                         break
             
-            # 개별 연도 추출 (start_year 또는 end_year 중 하나만 있는 경우)
-            if 'start_year' not in extracted and 'end_year' not in extracted:
-                for pattern in year_patterns:
-                    match = re.search(pattern, message_lower)
-                    if match:
-                        year = int(match.group(1))
-                        if year in self.valid_years:
+                # 개별 연도 추출 (start_year 또는 end_year 중 하나만 있는 경우)
+                if 'start_year' not in extracted and 'end_year' not in extracted:
+                    for match in _YEAR_RE.finditer(message):
+                        year = int(match.group(match.lastindex))
+                        if self._in_bounds("start_year", year):
                             # 기존에 start_year가 있으면 end_year로, 없으면 start_year로 설정
                             if 'start_year' in existing_params:
                                 extracted['end_year'] = year
-                                print(f"🔍 [ParameterCollector] Urban analysis: extracted end_year={year}")
+                                logger.debug("🔍 [ParameterCollector] Urban analysis: extracted end_year=%s", year)
                             else:
                                 extracted['start_year'] = year
-                                print(f"🔍 [ParameterCollector] Urban analysis: extracted start_year={year}")
+                                logger.debug("🔍 [ParameterCollector] Urban analysis: extracted start_year=%s", year)
                             break
-        else:
+        elif "year" in needed:
             # 다른 분석 유형의 경우 year 추출
-            for pattern in year_patterns:
-                match = re.search(pattern, message_lower)
-                if match:
-                    year = int(match.group(1))
-                    if year in self.valid_years:
-                        extracted['year'] = year
-                        break
+            for match in _YEAR_RE.finditer(message):
+                year = int(match.group(match.lastindex))
+                if self._in_bounds("year", year):
+                    extracted['year'] = year
+                    break
         
         # 임계값 추출
-        threshold_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:meter|m|meters|미터)', # 한국어 "미터" 패턴 추가
-            r'threshold\s*:?\s*(\d+(?:\.\d+)?)',
-            r'(\d+(?:\.\d+)?)\s*m\s*threshold'
-        ]
-        
-        for pattern in threshold_patterns:
-            match = re.search(pattern, message_lower)
-            if match:
-                threshold = float(match.group(1))
-                if self.valid_thresholds[0] <= threshold <= self.valid_thresholds[1]:
+        if "threshold" in needed:
+            for match in _THRESHOLD_RE.finditer(message):
+                threshold = float(match.group(match.lastindex))
+                if self._in_bounds("threshold", threshold):
                     extracted['threshold'] = threshold
                     break
         
         # 위치 정보 추출 (도시/국가)
-        # 먼저 도시 검색 시도
-        city_result = location_matcher.extract_location_from_message(message, "city")
-        if city_result["found"]:
-            if city_result.get("exact_match", False):
-                extracted['city_name'] = city_result["city"]
-                extracted['country_name'] = city_result["country"]
-                extracted['coordinates'] = city_result["coordinates"]
-                # 성공적으로 위치를 찾았으므로 기존 제안 및 오류 제거
-                if existing_params:
-                    for key in ['location_error', 'suggestion_message', 'suggested_city', 'suggested_country']:
-                        if key in existing_params:
-                            del existing_params[key]
-            else:
-                # 유사한 도시 제안
-                extracted['suggested_city'] = city_result.get("suggested_city")
-                extracted['suggested_country'] = city_result.get("suggested_country")
-                extracted['suggestion_message'] = city_result.get("message")
-        else:
-            # 도시를 찾지 못한 경우 국가 검색 시도
-            country_result = location_matcher.extract_location_from_message(message, "country")
-            if country_result["found"]:
-                if country_result.get("exact_match", False):
-                    extracted['country_name'] = country_result["country"]
-                    # 해당 국가의 주요 도시들 제안
-                    if country_result.get("cities"):
-                        extracted['suggested_cities'] = country_result["cities"]
+        if needed & {"city_name", "country_name"}:
+            # 도시 → 국가 순으로 한 번에 검색
+            location_result = _match_location(message)
+            if not location_result["found"]:
+                # 위치 정보를 찾을 수 없음
+                extracted['location_error'] = "위치 정보를 찾을 수 없습니다."
+            elif location_result["match_type"] == "city":
+                if location_result.get("exact_match", False):
+                    extracted['city_name'] = location_result["city"]
+                    extracted['country_name'] = location_result["country"]
+                    extracted['coordinates'] = dict(location_result["coordinates"])
                     # 성공적으로 위치를 찾았으므로 기존 제안 및 오류 제거
-                    if existing_params:
-                        for key in ['location_error', 'suggestion_message', 'suggested_city', 'suggested_country']:
-                            if key in existing_params:
-                                del existing_params[key]
+                    self._clear_location_feedback(existing_params)
                 else:
-                    # 유사한 국가 제안
-                    extracted['suggested_country'] = country_result.get("suggested_country")
-                    extracted['suggestion_message'] = country_result.get("message")
+                    # 유사한 도시 제안
+                    extracted['suggested_city'] = location_result.get("suggested_city")
+                    extracted['suggested_country'] = location_result.get("suggested_country")
+                    extracted['suggestion_message'] = location_result.get("message")
+            elif location_result.get("exact_match", False):
+                extracted['country_name'] = location_result["country"]
+                # 해당 국가의 주요 도시들 제안
+                if location_result.get("cities"):
+                    # 캐시된 결과와 공유하지 않도록 도시 dict까지 복사
+                    extracted['suggested_cities'] = [dict(city) for city in location_result["cities"]]
+                # 성공적으로 위치를 찾았으므로 기존 제안 및 오류 제거
+                self._clear_location_feedback(existing_params)
             else:
-                # 위치 정보를 찾을 수 없음
-                extracted['location_error'] = "위치 정보를 찾을 수 없습니다."
+                # 유사한 국가 제안
+                extracted['suggested_country'] = location_result.get("suggested_country")
+                extracted['suggestion_message'] = location_result.get("message")
         
         # 토픽 모델링 매개변수
         if analysis_type == "topic_modeling":
             # 방법 추출
-            method_patterns = [
-                r'\b(lda|nmf|bertopic)\b',
-                r'method\s*:?\s*(lda|nmf|bertopic)'
-            ]
-            for pattern in method_patterns:
-                match = re.search(pattern, message_lower)
+            if "method" in needed:
+                match = _METHOD_RE.search(message)
                 if match:
-                    extracted['method'] = match.group(1)
-                    break
+                    extracted['method'] = match.group(1).lower()
             
             # 토픽 개수 추출
-            n_topics_patterns = [
-                r'(\d+)\s*(?:topics|topic)',
-                r'n_topics\s*:?\s*(\d+)'
-            ]
-            for pattern in n_topics_patterns:
-                match = re.search(pattern, message_lower)
-                if match:
-                    n_topics = int(match.group(1))
-                    if 2 <= n_topics <= 20:
+            if "n_topics" in needed:
+                for match in _N_TOPICS_RE.finditer(message):
+                    n_topics = int(match.group(match.lastindex))
+                    if self._in_bounds("n_topics", n_topics):
                         extracted['n_topics'] = n_topics
                         break
         
         return extracted
     
+    @staticmethod
+    def _clear_location_feedback(existing_params: Optional[Dict[str, Any]]) -> None:
+        """위치 확정 시 이전 턴의 위치 제안/오류 항목 제거"""
+        if existing_params:
+            for key in _LOCATION_FEEDBACK_KEYS:
+                existing_params.pop(key, None)
+    
     def _validate_parameters(self, params: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
         """매개변수 검증"""
-        required = self.required_params.get(analysis_type, [])
-        missing = []
-        invalid = []
-        
-        for param in required:
-            if param not in params or params[param] is None:
-                missing.append(param)
-            elif param == "year" and params[param] not in self.valid_years:
-                invalid.append(f"year must be between 2000-2024, got {params[param]}")
-            elif param == "start_year" and params[param] not in self.valid_years:
-                invalid.append(f"start_year must be between 2000-2024, got {params[param]}")
-            elif param == "end_year" and params[param] not in self.valid_years:
-                invalid.append(f"end_year must be between 2000-2024, got {params[param]}")
-            elif param == "threshold" and not (self.valid_thresholds[0] <= params[param] <= self.valid_thresholds[1]):
-                invalid.append(f"threshold must be between {self.valid_thresholds[0]}-{self.valid_thresholds[1]}, got {params[param]}")
+        # 필수 매개변수 값을 한 번씩만 조회
+        values = [(param, params.get(param)) for param in self.required_params.get(analysis_type, ())]
+        missing = [param for param, value in values if value is None]
+        invalid = [
+            f"{param} must be between {self.numeric_bounds[param][0]}-{self.numeric_bounds[param][1]}, got {value}"
+            for param, value in values
+            if value is not None and param in self.numeric_bounds and not self._in_bounds(param, value)
+        ]
         
         # urban_analysis의 경우 start_year <= end_year 검증
         if analysis_type == "urban_analysis" and "start_year" in params and "end_year" in params:
@@ -233,6 +262,11 @@ class ParameterCollector:
     
     def are_all_parameters_collected(self, params: Dict[str, Any], analysis_type: str) -> bool:
         """모든 필수 매개변수가 수집되었는지 확인"""
+        # 빠진 항목이 있으면 범위 검증까지 갈 필요 없음
+        required = self._required_sets.get(analysis_type, frozenset())
+        if not required <= params.keys() or any(params[key] is None for key in required):
+            return False
+        
         validation = self._validate_parameters(params, analysis_type)
         return validation["valid"] and len(validation["missing"]) == 0
 
@@ -242,11 +276,48 @@ class ParameterCollector:
             existing_params = {}
         
         # 새로 추출된 매개변수
-        extracted = await self._extract_parameters(message, analysis_type, existing_params)
+        extracted = self._extract_parameters(message, analysis_type, existing_params)
+        
+        # 기존 매개변수와 병합 (새로 추출된 값이 없으면 복사 없이 그대로 사용)
+        all_params = {**existing_params, **extracted} if extracted else existing_params
+        return self._build_result(all_params, analysis_type)
+    
+    def collect_simple_reply(self, message: str, analysis_type: str, existing_params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """연도/임계값만 담긴 단답형 응답을 위치 검색 없이 반영
+        
+        "2020", "1.5m"처럼 아직 비어 있는 매개변수 하나만 채우는 응답이면
+        collect_parameters와 같은 형식의 결과를 반환하고, 그 외에는 None을 반환합니다.
+        """
+        if existing_params is None:
+            existing_params = {}
+        
+        text = message.strip()
+        required = self.required_params.get(analysis_type, [])
+        
+        match = _BARE_YEAR_RE.fullmatch(text)
+        if match:
+            year = int(match.group(1))
+            if analysis_type == "urban_analysis":
+                key = "end_year" if "start_year" in existing_params else "start_year"
+            else:
+                key = "year"
+            value = year if self._in_bounds(key, year) else None
+        else:
+            match = _BARE_THRESHOLD_RE.fullmatch(text)
+            if not match:
+                return None
+            threshold = float(match.group(1))
+            key = "threshold"
+            value = threshold if self._in_bounds(key, threshold) else None
         
-        # 기존 매개변수와 병합
-        all_params = {**existing_params, **extracted}
+        # 범위를 벗어나거나 이미 수집된 값을 바꾸는 경우는 전체 추출 경로로 처리
+        if value is None or key not in required or existing_params.get(key) is not None:
+            return None
         
+        return self._build_result({**existing_params, key: value}, analysis_type)
+    
+    def _build_result(self, all_params: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
+        """병합된 매개변수를 정리/검증하여 수집 결과 생성"""
         # location_error가 있지만 city_name과 country_name이 모두 있으면 location_error 제거
         if ('location_error' in all_params and 
             'city_name' in all_params and 'country_name' in all_params and
@@ -269,20 +340,8 @@ class ParameterCollector:
             if missing_param in self.parameter_questions[analysis_type]:
                 return self.parameter_questions[analysis_type][missing_param]
         
-        # 기본 질문들
-        questions = {
-            "year": "어떤 연도로 분석하시겠습니까? (예: 2020, 2018)",
-            "start_year": "시작 연도를 입력해주세요 (예: 2014, 2015)",
-            "end_year": "종료 연도를 입력해주세요 (예: 2020, 2019)",
-            "threshold": "해수면 상승 임계값을 설정해주세요. (예: 1.0m, 2.5m)",
-            "city_name": "어떤 도시를 분석하시겠습니까? (예: Seoul, Busan, New York)",
-            "country_name": "어떤 국가를 분석하시겠습니까? (예: South Korea, United States)",
-            "method": "토픽 모델링 방법을 선택해주세요. (lda, nmf, bertopic)",
-            "n_topics": "몇 개의 토픽으로 분석하시겠습니까? (예: 5, 10)"
-        }
-        
         if missing_params:
-            return questions.get(missing_params[0], f"{missing_params[0]} 정보를 입력해주세요.")
+            return _DEFAULT_QUESTIONS.get(missing_params[0], f"{missing_params[0]} 정보를 입력해주세요.")
         return "추가 정보가 필요합니다."
 
 # 전역 인스턴스 생성
@@ -2,9 +2,7 @@
 Topic Modeling Agent Prompts
 """
 
-def get_topic_modeling_agent_instruction() -> str:
-    """Return the topic modeling agent's instructions."""
-    return """
+TOPIC_MODELING_AGENT_INSTRUCTION = """
 You are a specialized topic modeling analysis agent.
 
 Key roles:
@@ -32,3 +30,7 @@ Results provided:
 
 Always provide accurate and reliable analysis results.
 """
+
+def get_topic_modeling_agent_instruction() -> str:
+    """Return the topic modeling agent's instructions."""
+    return TOPIC_MODELING_AGENT_INSTRUCTION
@@ -2,18 +2,21 @@
 Topic Modeling Agent Tools
 """
 
+import logging
 from typing import Dict, Any
 from google.adk.tools import ToolContext
 
 from ..shared.tools.geospatial_tools import get_topic_modeling_analysis
 
+logger = logging.getLogger(__name__)
+
 async def execute_topic_modeling_analysis(
     method: str = "lda",
     n_topics: int = 5,
     tool_context: ToolContext = None
 ) -> Dict[str, Any]:
     """토픽 모델링 분석을 실행합니다."""
-    print(f"📊 [Topic Modeling Agent] Executing analysis: {method}, {n_topics} topics")
+    logger.debug("📊 [Topic Modeling Agent] Executing analysis: %s, %s topics", method, n_topics)
     
     result = await get_topic_modeling_analysis(
         method=method,
@@ -2,9 +2,7 @@
 Urban Analysis Agent Prompts
 """
 
-def get_urban_agent_instruction() -> str:
-    """Return the urban analysis agent's instructions."""
-    return """
+URBAN_AGENT_INSTRUCTION = """
 You are a specialized urban area analysis agent.
 
 Key roles:
@@ -34,3 +32,7 @@ Results provided:
 
 Always provide accurate and reliable analysis results.
 """
+
+def get_urban_agent_instruction() -> str:
+    """Return the urban analysis agent's instructions."""
+    return URBAN_AGENT_INSTRUCTION
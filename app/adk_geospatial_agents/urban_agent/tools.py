@@ -2,11 +2,14 @@
 Urban Analysis Agent Tools
 """
 
+import logging
 from typing import Dict, Any
 from google.adk.tools import ToolContext
 
 from ..shared.tools.geospatial_tools import get_urban_area_analysis
 
+logger = logging.getLogger(__name__)
+
 async def execute_urban_analysis(
     year: int,
     city_name: str,
@@ -15,7 +18,7 @@ async def execute_urban_analysis(
     tool_context: ToolContext = None
 ) -> Dict[str, Any]:
     """도시 지역 분석을 실행합니다."""
-    print(f"🏙️ [Urban Agent] Executing analysis: {city_name}, {country_name}, {year}")
+    logger.debug("🏙️ [Urban Agent] Executing analysis: %s, %s, %s", city_name, country_name, year)
     
     result = await get_urban_area_analysis(
         year=year,
@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from typing import List, Optional
 import json
+import orjson
 import tempfile
 from dotenv import load_dotenv
 
@@ -14,6 +15,9 @@ router = APIRouter()
 load_dotenv()
 
 # --- GEE Setup ---
+# 분석 라우트는 getInfo/getThumbURL 요청을 동시에 많이 보내므로 high-volume 엔드포인트 사용
+EE_HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
 def gee_initialize():
     """Initialize Google Earth Engine with service account authentication."""
     try:
@@ -36,19 +40,19 @@ def gee_initialize():
                 email='gee-demo@dataground-demo.iam.gserviceaccount.com',  # JSON의 client_email 사용
                 key_file=temp_path,
             )
-            ee.Initialize(credentials, project='dataground-demo')
+            ee.Initialize(credentials, project='dataground-demo', opt_url=EE_HIGH_VOLUME_URL)
             print("GEE initialized with service account authentication")
         else:
             print(f"Service account file '{service_account_file}' not found. Attempting interactive authentication...")
             ee.Authenticate()
-            ee.Initialize(project='dataground-demo')
+            ee.Initialize(project='dataground-demo', opt_url=EE_HIGH_VOLUME_URL)
             print("GEE initialized with interactive authentication")
             
     except Exception as e:
         print(f"Error initializing GEE: {str(e)}")
         try:
             ee.Authenticate()
-            ee.Initialize(project='dataground-demo')
+            ee.Initialize(project='dataground-demo', opt_url=EE_HIGH_VOLUME_URL)
             print("GEE initialized with interactive authentication (fallback)")
         except Exception as e2:
             print(f"Failed to initialize GEE: {str(e2)}")
@@ -514,7 +518,7 @@ def infrastructure_exposure(
     try:
         resp = requests.post(overpass_url, data={'data': overpass_query}, timeout=30)
         if resp.status_code == 200:
-            osm = resp.json()
+            osm = orjson.loads(resp.content)
             for el in osm.get('elements', []):
                 name = el.get('tags', {}).get('name', 'Unknown')
                 if 'amenity' in el.get('tags', {}):
@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, HTTPException, status, Header, Body
 from sqlalchemy.orm import Session
 from . import schemas, models, database, utils
 from .adk_chat import send_message, generate_ai_response, get_chat_history
-import openai
 import os
 from typing import List, Optional, Dict
 from datetime import datetime
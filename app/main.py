@@ -1,15 +1,46 @@
-from dotenv import load_dotenv
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+from contextlib import asynccontextmanager
 
-# Load environment variables first
-load_dotenv()
-
+from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from . import auth, chat, file_upload, analysis, location
+# Load environment variables first - the app modules below read them at import time
+# (database.DATABASE_URL, utils.SECRET_KEY), so they have to follow this call
+load_dotenv()
+
+from . import auth, chat, file_upload, analysis, location  # noqa: E402
+from .adk_geospatial_agents.shared.tools.geospatial_tools import close_http_client  # noqa: E402
+
+def _configure_logging():
+    """Configure root logging before the app is created.
+
+    Agent diagnostics are emitted at DEBUG; set LOG_LEVEL=DEBUG during development.
+    Records go through a queue so formatting and stream I/O happen on a listener thread.
+    """
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[queue_handler])
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The geospatial tools' keep-alive HTTP client lives for the whole process; close its pool on shutdown
+    yield
+    await close_http_client()
+
+_configure_logging()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,28 @@
+"""
+Intent detection tests - mixed-keyword messages must resolve by intent priority
+"""
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from app.adk_geospatial_agents.main_agent.tools import _detect
+
+
+@pytest.mark.parametrize("message, expected", [
+    # 단일 키워드
+    ("sea level rise in Jakarta", "sea_level_rise"),
+    ("urban growth in Seoul", "urban_analysis"),
+    ("인프라 노출 분석", "infrastructure_analysis"),
+    ("토픽 모델링 해줘", "topic_modeling"),
+    # 앞쪽 토큰의 키워드보다 우선순위가 높은 키워드가 뒤에 있는 경우
+    ("urban sea level rise", "sea_level_rise"),
+    ("도시 해수면 상승 분석", "sea_level_rise"),
+    ("infrastructure near sea level", "sea_level_rise"),
+    ("토픽 도시", "urban_analysis"),
+    # 앞쪽 토큰이 최우선 intent인 경우
+    ("slr urban", "sea_level_rise"),
+    ("hello", None),
+])
+def test_detect_uses_intent_priority(message, expected):
+    assert _detect(message) == expected